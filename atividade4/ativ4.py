@@ -17,6 +17,13 @@ def generate_attribution(m: int, n: int):
     return res
 
 
+def get_restrictions(attribution: np.ndarray) -> np.ndarray:
+    """Index matrix of the attribution restrictions: column j holds the 
+    indices of the variables of restriction j, so that `x[restrictions]` 
+    reshapes a flat vector into an (m, n) matrix (agents by tasks)."""
+    return np.array([np.where(row == 1)[0] for row in attribution]).T
+
+
 class Problem:
     "Just a convenient data structure for the GAP parameters."
     def __init__(self, 
@@ -31,6 +38,7 @@ class Problem:
         self.m = m 
         self.n = n
         self.attribution = generate_attribution(self.m, self.n)
+        self.restrictions = get_restrictions(self.attribution)
 
     def get_all_problem_parameters(self):
         return self.objective, self.attribution, self.knapsack, self.b, self.m, self.n
@@ -55,20 +63,22 @@ def solve_relaxation(
     knapsack: np.ndarray,
     b: np.ndarray,
     m: int,
-    n: int
+    n: int,
+    restrictions: np.ndarray | None = None
 ) -> tuple[np.ndarray, float]:
     new_obj = u @ knapsack + objective 
 
-    # the line below will create a matrix of indices to reshape the `new_obj`
-    # array back into a matrix, so we can extract the cost relative to each variable
-    restrictions = [np.where(row == 1)[0] for row in attribution]
+    # the matrix of indices reshapes `new_obj` into (m, n), so we can extract
+    # the cost relative to each variable (precomputed in `Problem`)
+    if restrictions is None:
+        restrictions = get_restrictions(attribution)
 
     obj_reshaped = new_obj[restrictions]
     solution = np.zeros(m * n)
 
-    for row, indices in zip(obj_reshaped, restrictions):
-        idx = row.argmin() # we're choosing index of the variable with lowest cost
-        solution[indices[idx]] = 1 # now we're using the index to select the variable
+    # for each task, the agent with the lowest cost
+    agents = obj_reshaped.argmin(axis=0)
+    solution[restrictions[agents, np.arange(restrictions.shape[1])]] = 1
     
     # `cast` is used only to satisfy the typechecker
     return solution, cast(float, solution @ new_obj - u @ b) 
@@ -85,15 +95,18 @@ def check_optimality(
     objective: np.ndarray,
     attribution: np.ndarray,
     knapsack: np.ndarray,
-    b: np.ndarray
+    b: np.ndarray,
+    restrictions: np.ndarray | None = None
 ) -> CheckResult:
-    for row in attribution:
-        if not math.isclose(solution @ row, 1.):
-            return CheckResult.VIOLATES_ATTRIBUTION_RESTRICTIONS
+    if restrictions is None:
+        restrictions = get_restrictions(attribution)
+    # same tolerance as math.isclose
+    if not np.all(np.isclose(solution[restrictions].sum(axis=0), 1., 
+                             rtol=1e-9, atol=0.)):
+        return CheckResult.VIOLATES_ATTRIBUTION_RESTRICTIONS
         
-    for row, bi in zip(knapsack, b):
-        if solution @ row > bi:
-            return CheckResult.VIOLATES_KNAPSACK_RESTRICTIONS
+    if np.any(knapsack @ solution > b):
+        return CheckResult.VIOLATES_KNAPSACK_RESTRICTIONS
         
     if math.isclose(objective @ solution, value):
         return CheckResult.OPTIMAL_SOLUTION
@@ -111,18 +124,12 @@ def get_next_u(
     b: np.ndarray,
     verbose: bool = False
 ):
-    subgradient = []
-    for row, bi in zip(knapsack, b):
-        subgradient.append(solution @ row - bi)
-    subgradient = np.array(subgradient)
+    subgradient = knapsack @ solution - b
     if verbose: print(subgradient)
 
-    step = lamda * (z_bar - value) / np.linalg.norm(subgradient)**2
+    step = lamda * (z_bar - value) / (subgradient @ subgradient)
 
-    next_u = u + step * subgradient
-    next_u = np.array([
-        ui if ui > 0 else 0 for ui in next_u
-    ])
+    next_u = np.maximum(u + step * subgradient, 0)
 
     return next_u    
 
@@ -154,7 +161,8 @@ def solve_problem(
             attribution,
             knapsack,
             b,
-            m, n
+            m, n,
+            problem.restrictions
         )
 
         if verbose: print(f'{solution=}\n{value=}')
@@ -172,7 +180,8 @@ def solve_problem(
             objective,
             attribution,
             knapsack,
-            b
+            b,
+            problem.restrictions
         )
 
         if verification == CheckResult.OPTIMAL_SOLUTION:
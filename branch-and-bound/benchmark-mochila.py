@@ -0,0 +1,205 @@
+# UFC/DEMA/Programacao Inteira, 2023.1
+#
+# Medicao de desempenho do branch-and-bound e da relaxacao linear para o
+# problema da mochila 0-1, sobre as familias classicas de instancias
+# (nao correlacionadas, fracamente/fortemente correlacionadas,
+# inversamente fortemente correlacionadas e subset-sum).
+#
+# Exemplo:
+#   python benchmark-mochila.py --tamanhos 10 100 1000 --saida base.json
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+pm01 = importlib.import_module('relaxlinear-pm01')
+
+# Amplitude R dos coeficientes: pesos e lucros em [1, R]
+AMPLITUDE = 1000
+# Limite de tempo (s) de cada execucao do branch-and-bound: as familias
+# fortemente correlacionadas e subset-sum de 1000 itens podem nao terminar
+LIMITE_TEMPO = 60.
+
+
+def nao_correlacionadas(rng: np.random.Generator, n: int):
+    pesos = rng.integers(1, AMPLITUDE, n, endpoint=True)
+    lucros = rng.integers(1, AMPLITUDE, n, endpoint=True)
+    return lucros, pesos
+
+
+def fracamente_correlacionadas(rng: np.random.Generator, n: int):
+    pesos = rng.integers(1, AMPLITUDE, n, endpoint=True)
+    desvio = rng.integers(-AMPLITUDE // 10, AMPLITUDE // 10, n, endpoint=True)
+    lucros = np.maximum(pesos + desvio, 1)
+    return lucros, pesos
+
+
+def fortemente_correlacionadas(rng: np.random.Generator, n: int):
+    pesos = rng.integers(1, AMPLITUDE, n, endpoint=True)
+    lucros = pesos + AMPLITUDE // 10
+    return lucros, pesos
+
+
+def inversamente_fortemente_correlacionadas(rng: np.random.Generator, n: int):
+    lucros = rng.integers(1, AMPLITUDE, n, endpoint=True)
+    pesos = lucros + AMPLITUDE // 10
+    return lucros, pesos
+
+
+def subset_sum(rng: np.random.Generator, n: int):
+    pesos = rng.integers(1, AMPLITUDE, n, endpoint=True)
+    return pesos.copy(), pesos
+
+
+FAMILIAS = {
+    'nao_correlacionadas': nao_correlacionadas,
+    'fracamente_correlacionadas': fracamente_correlacionadas,
+    'fortemente_correlacionadas': fortemente_correlacionadas,
+    'inversamente_fortemente_correlacionadas': inversamente_fortemente_correlacionadas,
+    'subset_sum': subset_sum,
+}
+
+
+def gerar_instancia(familia: str, n: int, semente: int
+                    ) -> tuple[list[int], list[int], int]:
+    '''Gera uma instancia `(lucros, pesos, capacidade)` da familia dada,
+    com capacidade igual a metade da soma dos pesos.'''
+    if familia not in FAMILIAS:
+        raise ValueError(f'familia deve ser uma de {tuple(FAMILIAS)}.')
+    rng = np.random.default_rng(semente)
+    lucros, pesos = FAMILIAS[familia](rng, n)
+    return lucros.tolist(), pesos.tolist(), int(pesos.sum() // 2)
+
+
+def medir_relaxacao(lucros, pesos, capacidade) -> dict:
+    inicio = time.perf_counter()
+    valor, _, _ = pm01.relaxacao_linear_mochila(lucros, pesos, capacidade)
+    tempo = time.perf_counter() - inicio
+    return {'tempo': tempo, 'valor': valor}
+
+
+def medir_branch_and_bound(lucros, pesos, capacidade, **opcoes) -> dict:
+    melhorias: list[tuple[float, float]] = []
+    inicio = time.perf_counter()
+    melhor, _, estatisticas = pm01.branch_and_bound_mochila(
+        lucros, pesos, capacidade, registro='nenhum',
+        ao_melhorar=lambda valor, _: melhorias.append(
+            (time.perf_counter() - inicio, valor)),
+        **opcoes)
+    tempo = time.perf_counter() - inicio
+    # o instante da ultima melhoria e' quando a solucao otima foi obtida (a
+    # melhor encontrada, se a execucao foi interrompida)
+    tempo_ate_otimo = melhorias[-1][0] if len(melhorias) > 0 else tempo
+    nos = estatisticas.nos_processados
+    resultado = {
+        'tempo': tempo,
+        'valor': melhor[0],
+        'nos': nos,
+        'nos_por_segundo': nos / tempo if tempo > 0 else None,
+        'tempo_ate_otimo': tempo_ate_otimo,
+    }
+    resultado.update(estatisticas.como_dict())
+    return resultado
+
+
+def pico_de_memoria(funcao, *args, **kwargs) -> int:
+    '''Pico de memoria alocada (em bytes) durante a chamada. Feito numa
+    execucao separada, pois o tracemalloc deixa o codigo mais lento; os
+    limites de nos e de tempo em `kwargs` valem tambem para ela.'''
+    tracemalloc.start()
+    try:
+        funcao(*args, **kwargs)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico
+
+
+def executar(familias: list[str],
+             tamanhos: list[int],
+             sementes: list[int],
+             medir_memoria: bool = True,
+             verbose: bool = False,
+             **opcoes) -> list[dict]:
+    '''Mede a relaxacao linear e o branch-and-bound em cada combinacao de
+    familia, tamanho e semente. As `opcoes` vao para o branch-and-bound,
+    inclusive os limites `limite_nos` e `limite_tempo`; as execucoes que os
+    atingem ficam com `interrompido` verdadeiro no resultado.'''
+    resultados = []
+    for familia in familias:
+        for n in tamanhos:
+            for semente in sementes:
+                lucros, pesos, capacidade = gerar_instancia(familia, n, semente)
+                medidas = {
+                    'relaxacao': (medir_relaxacao, (lucros, pesos, capacidade), {}),
+                    'branch_and_bound': (medir_branch_and_bound,
+                                         (lucros, pesos, capacidade), opcoes),
+                }
+                for metodo, (medir, args, kwargs) in medidas.items():
+                    resultado = {'familia': familia, 'n': n, 'semente': semente,
+                                 'metodo': metodo}
+                    resultado.update(medir(*args, **kwargs))
+                    if medir_memoria:
+                        resultado['memoria_pico'] = pico_de_memoria(
+                            medir, *args, **kwargs)
+                    if verbose:
+                        print(resultado)
+                    resultados.append(resultado)
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark do branch-and-bound para a mochila 0-1.')
+    parser.add_argument('--familias', nargs='+', default=list(FAMILIAS),
+                        choices=list(FAMILIAS))
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=[10, 100, 1000])
+    parser.add_argument('--sementes', nargs='+', type=int, default=[0])
+    parser.add_argument('--selecao', default='profundidade', choices=pm01.SELECOES)
+    parser.add_argument('--reduzir', action='store_true')
+    parser.add_argument('--processos', type=int, default=None)
+    parser.add_argument('--limite-nos', type=int, default=None,
+                        help='nos processados por execucao (padrao: sem limite)')
+    parser.add_argument('--limite-tempo', type=float, default=LIMITE_TEMPO,
+                        help='segundos por execucao (padrao: %(default)s)')
+    parser.add_argument('--sem-memoria', action='store_true',
+                        help='nao mede o pico de memoria')
+    parser.add_argument('--saida', default=None,
+                        help='arquivo JSON com os resultados (padrao: stdout)')
+    args = parser.parse_args()
+
+    resultados = executar(args.familias, args.tamanhos, args.sementes,
+                          medir_memoria=not args.sem_memoria,
+                          verbose=args.saida is not None,
+                          selecao=args.selecao,
+                          reduzir=args.reduzir,
+                          processos=args.processos,
+                          limite_nos=args.limite_nos,
+                          limite_tempo=args.limite_tempo)
+    relatorio = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'plataforma': platform.platform(),
+        'opcoes': {'selecao': args.selecao, 'reduzir': args.reduzir,
+                   'processos': args.processos, 'limite_nos': args.limite_nos,
+                   'limite_tempo': args.limite_tempo},
+        'resultados': resultados,
+    }
+    if args.saida is None:
+        json.dump(relatorio, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.saida, 'w') as arquivo:
+            json.dump(relatorio, arquivo, indent=2)
+
+
+if __name__ == '__main__':
+    main()
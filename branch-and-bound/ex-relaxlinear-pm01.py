@@ -49,11 +49,15 @@ def RelaxacaoLinearMochila01(lucros, pesos, capacidade, varfixas=dict()):
     
     return (vfobj, sol, True)
 
-def nome(d):
-    s = '_'
-    for ch,val in d.items():
-        s += str(ch) + str(val)
-    return s
+# Cada subproblema e' guardado como uma trilha (pai, variavel, valor): os
+# filhos compartilham as fixacoes dos ancestrais em vez de copiar o
+# dicionario inteiro, e o dicionario so e' reconstruido ao desempilhar.
+def fixacoes(no):
+    trilha = []
+    while no is not None:
+        (no, var, val) = no
+        trilha.append((var, val))
+    return dict(reversed(trilha))
 
 #---------------------------------------------------------------------
 # Exemplo de problema da mochila 0-1
@@ -64,12 +68,24 @@ C = 12
 n = len(L)
 TOL = 1e-6
 
-Pilha = [ dict() ]
+# A arvore e' registrada com ids inteiros (a raiz e' o no 0) e so' e'
+# convertida num grafo do graphviz ao final, se DESENHAR_ARVORE for True.
+DESENHAR_ARVORE = True
+ESTILOS = {
+    'inviavel': dict(shape="point", color="red"),
+    'podado': dict(shape="point", color="yellow"),
+    'dominada': dict(shape="point", color="green"),
+    'heuristica': dict(shape="point", fillcolor="blue"),
+    'ramificado': dict(shape="point", fillcolor="white"),
+}
+Nos = []     # (id, estilo, rotulo) de cada no processado
+Arestas = [] # (id do pai, id do filho)
+
+Pilha = [ (0, None) ]
 
 MSI = None
 numNos = 0
 
-arvore = gv.Digraph('bab', filename='bab-m01.gv')
 print("Legenda da arvore:")
 print("\tVermelho: subproblema inviavel;")
 print("\tAmarelo: subproblema podado por nao-otimalidade;")
@@ -82,7 +98,8 @@ print("\tRetangulo: nova solucao inteira incumbente.")
 while len(Pilha) > 0:
     
     # Obter o problema subproblema a ser resolvido
-    atual = Pilha.pop()
+    (idAtual, no) = Pilha.pop()
+    atual = fixacoes(no)
 
     numNos += 1
 
@@ -91,10 +108,10 @@ while len(Pilha) > 0:
     
     # Se o subproblema e' inviavel, ignore-o e siga para o proximo
     if viavelRL == False:
-        arvore.node(f"no{nome(atual)}", shape="point", color="red")
+        Nos.append((idAtual, 'inviavel', None))
         continue
     elif MSI != None and zRL < MSI['z']:
-        arvore.node(f"no{nome(atual)}", shape="point", color="yellow")
+        Nos.append((idAtual, 'podado', None))
         continue
 
     # Detectar se existe alguma variavel com valor fracionario
@@ -108,9 +125,9 @@ while len(Pilha) > 0:
     if varRamificacao == None:
         if MSI == None or zRL > MSI['z']:
             MSI = {'z': zRL, 'x': solRL}
-            arvore.node(f"no{nome(atual)}", shape="rectangle", label=f"{zRL}")
+            Nos.append((idAtual, None, f"{zRL}"))
         else:
-            arvore.node(f"no{nome(atual)}", shape="point", color="green")
+            Nos.append((idAtual, 'dominada', None))
 
     else: # Se a solucao nao e' inteira, siga dividindo
 
@@ -124,23 +141,28 @@ while len(Pilha) > 0:
         solRLb[varRamificacao] = 0
         if MSI == None or zRLb > MSI['z']:
             MSI = {'z': zRLb, 'x': solRLb}
-            arvore.node(f"no{nome(atual)}", shape="point", fillcolor="blue")
+            Nos.append((idAtual, 'heuristica', None))
         else:
-            arvore.node(f"no{nome(atual)}", shape="point", fillcolor="white")
-
-        fixaem0 = dict(atual)
-        fixaem0[varRamificacao] = 0
-
-        fixaem1 = dict(atual)
-        fixaem1[varRamificacao] = 1
+            Nos.append((idAtual, 'ramificado', None))
 
         # Anexar aa lista de subproblemas a resolver
-        Pilha.append(fixaem1)
-        Pilha.append(fixaem0)
+        id0 = len(Arestas) + 1
+        id1 = len(Arestas) + 2
+        Pilha.append((id1, (no, varRamificacao, 1)))
+        Pilha.append((id0, (no, varRamificacao, 0)))
         
-        arvore.edge(f"no{nome(atual)}", f"no{nome(fixaem0)}")
-        arvore.edge(f"no{nome(atual)}", f"no{nome(fixaem1)}")
+        Arestas.append((idAtual, id0))
+        Arestas.append((idAtual, id1))
         
-arvore.view()
+if DESENHAR_ARVORE:
+    arvore = gv.Digraph('bab', filename='bab-m01.gv')
+    for (idNo, estilo, rotulo) in Nos:
+        if estilo is None:
+            arvore.node(f"no{idNo}", shape="rectangle", label=rotulo)
+        else:
+            arvore.node(f"no{idNo}", **ESTILOS[estilo])
+    for (pai, filho) in Arestas:
+        arvore.edge(f"no{pai}", f"no{filho}")
+    arvore.view()
 print(MSI)
 print(numNos)
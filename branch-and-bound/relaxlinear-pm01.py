@@ -8,109 +8,1002 @@
 # melhor solucao inteira obtida durante o processo, e apresente
 # esta solucao ao final.
 
+from array import array
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import heapq
+import inspect
+import multiprocessing as mp
+import time
+from typing import Callable
+
 import igraph as ig
 import matplotlib.pyplot as plt
+import numpy as np
+
+
+class InstanciaMochila:
+    '''Instancia do problema da mochila 0-1 pronta para ser reutilizada
+    em todos os nos do branch-and-bound.
+
+    Os itens sao ordenados pela razao lucro/peso uma unica vez e as somas
+    de prefixo dos pesos e lucros nessa ordem sao guardadas. Assim, a
+    relaxacao linear de um no com k variaveis fixas e' resolvida com uma
+    busca binaria sobre as somas de prefixo, corrigidas pelas variaveis
+    fixas, em O(k log k + log n log k) em vez de O(n log n + k n).'''
+    def __init__(self,
+                 lucros: list[int] | list[float],
+                 pesos: list[int] | list[float],
+                 capacidade: int | float,
+                 tolerancia: float = 1e-6) -> None:
+        self.lucros = np.asarray(lucros, dtype=float)
+        self.pesos = np.asarray(pesos, dtype=float)
+        self.capacidade = capacidade
+        self.tolerancia = tolerancia
+        self.n = len(self.lucros)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            razao = self.lucros / self.pesos
+        # ordenacao estavel: empates mantem a ordem dos indices
+        self.ordem = np.argsort(-razao, kind='stable')
+        self.posicao = np.empty(self.n, dtype=np.intp)
+        self.posicao[self.ordem] = np.arange(self.n)
+        self.pesos_acumulados = np.concatenate(
+            ([0.], np.cumsum(self.pesos[self.ordem])))
+        self.lucros_acumulados = np.concatenate(
+            ([0.], np.cumsum(self.lucros[self.ordem])))
+
+    def limitante(self, varfixas: dict[int, float] | None = None
+                  ) -> tuple[float, int, float, int, bool]:
+        '''Resolve a relaxacao linear sem montar o vetor solucao.
+
+        Retorna `(vfobj, critico, fracao, corte, viavel)`: o valor da
+        relaxacao, o indice do item fracionario (-1 se nao houver), o valor
+        fracionario desse item, a posicao (na ordem por razao) do primeiro
+        item livre que nao coube inteiro e a viabilidade do subproblema.'''
+        b = 0.        # capacidade ja utilizada
+        vfobj = 0.    # valor da funcao objetivo
+        fixas: list[tuple[int, float, float]] = []
+        if varfixas:
+            for i, val in varfixas.items():
+                if val > self.tolerancia:
+                    b += val*self.pesos[i]
+                    vfobj += val*self.lucros[i]
+                fixas.append((int(self.posicao[i]),
+                              float(self.pesos[i]),
+                              float(self.lucros[i])))
+
+        if b > self.capacidade:
+            return vfobj, -1, 0., 0, bool(False)
+        residual = self.capacidade - b
+
+        # somas de prefixo dos pesos e lucros das variaveis fixas, na
+        # ordem por razao, para descontar das somas de prefixo globais
+        fixas.sort()
+        posicoes_fixas = [p for p, _, _ in fixas]
+        pesos_fixos = [0.]
+        lucros_fixos = [0.]
+        for _, peso, lucro in fixas:
+            pesos_fixos.append(pesos_fixos[-1] + peso)
+            lucros_fixos.append(lucros_fixos[-1] + lucro)
+
+        def peso_livre(t: int) -> float:
+            '''Peso dos itens livres nas posicoes [0, t).'''
+            return self.pesos_acumulados[t] \
+                - pesos_fixos[bisect_left(posicoes_fixas, t)]
+
+        # maior t tal que os itens livres em [0, t) cabem na mochila
+        inicio, fim = 0, self.n
+        while inicio < fim:
+            meio = (inicio + fim + 1) // 2
+            if peso_livre(meio) <= residual:
+                inicio = meio
+            else:
+                fim = meio - 1
+        corte = inicio
+
+        k = bisect_left(posicoes_fixas, corte)
+        vfobj += self.lucros_acumulados[corte] - lucros_fixos[k]
+        sobra = residual - (self.pesos_acumulados[corte] - pesos_fixos[k])
+
+        critico, fracao = -1, 0.
+        if corte < self.n and sobra > self.tolerancia:
+            # pela maximalidade de `corte`, o item nesta posicao e' livre
+            critico = int(self.ordem[corte])
+            fracao = sobra/self.pesos[critico]
+            vfobj += fracao*self.lucros[critico]
+
+        return float(vfobj), critico, float(fracao), corte, bool(True)
+
+    def solucao(self,
+                varfixas: dict[int, float] | None,
+                critico: int,
+                fracao: float,
+                corte: int) -> dict[int, float]:
+        '''Monta o vetor solucao (apenas entradas nao nulas) a partir do
+        resultado de `limitante`.'''
+        sol: dict[int, float] = dict()
+        if varfixas:
+            for i, val in varfixas.items():
+                if val > self.tolerancia:
+                    sol[i] = val
+        for i in self.ordem[:corte].tolist():
+            if varfixas is None or i not in varfixas:
+                sol[i] = 1
+        if critico != -1:
+            sol[critico] = fracao
+        return sol
+
+    def relaxacao(self, varfixas: dict[int, float] | None = None
+                  ) -> tuple[float, dict[int, float], bool]:
+        '''Relaxacao linear no mesmo formato de `relaxacao_linear_mochila`.'''
+        vfobj, critico, fracao, corte, viavel = self.limitante(varfixas)
+        if not viavel:
+            sol = {i: val for i, val in (varfixas or {}).items()
+                   if val > self.tolerancia}
+            return vfobj, sol, viavel
+        return vfobj, self.solucao(varfixas, critico, fracao, corte), viavel
+
 
 def relaxacao_linear_mochila(lucros: list[int] | list[float], 
                              pesos: list[int] | list[float], 
                              capacidade: int, 
                              varfixas: dict[int, float] | None = None,
                              tolerancia: float = 1e-6):
-    '''Algoritmo guloso para a relaxacao linear do problema da mochila 0-1'''
-    n = len(lucros)
+    '''Algoritmo guloso para a relaxacao linear do problema da mochila 0-1.
 
-    b = 0 # capacidade ja utilizada
-    sol: dict[int, float] = dict() # solucao parcial da relaxao linear
-    vfobj = 0.    # valor da funcao objetivo
-    indices = list(range(n)) # indices de variaveis livres
-    
-    # Se existem variaveis fixas, atualizamos a solucao e a fcao obj.
-    if varfixas is not None and len(varfixas) > 0:
-        for i,val in varfixas.items():
-            if val > tolerancia:
-                b += val*pesos[i]
-                sol[i] = val
-                vfobj += val*lucros[i]
-            indices.remove(i)
-    
-    if b > capacidade:
-        return vfobj, sol, bool(False)
-    
-    criterio = [(lucros[i]/pesos[i], i) for i in indices]
-    criterio.sort(key=lambda x: x[0], reverse=True)
-    
-    for _,i in criterio:
-        if b + pesos[i] <= capacidade:
+    Para resolver varias relaxacoes da mesma instancia, crie uma
+    `InstanciaMochila` e reutilize-a.'''
+    return InstanciaMochila(lucros, pesos, capacidade, tolerancia).relaxacao(varfixas)
+
+
+def reducao_mochila(instancia: InstanciaMochila
+                    ) -> tuple[dict[int, int], tuple[float, dict[int, float]]]:
+    '''Fixacao de variaveis por custo reduzido (reducao de Dembo-Hammer).
+
+    Com o item critico s da relaxacao da raiz, o limitante do problema com
+    x_j trocado do seu valor na relaxacao e' no maximo
+    z_RL - |p_j - (p_s/w_s) w_j|. Se isso nao supera uma solucao heuristica
+    (a gulosa que completa a mochila apos o item critico), x_j pode ser
+    fixada no valor da relaxacao. Quando os lucros sao inteiros, basta que
+    o limitante fique abaixo da heuristica mais 1.
+
+    Retorna as variaveis fixadas e a solucao heuristica, que deve ser
+    mantida como incumbente, pois a reducao pode eliminar solucoes que
+    apenas a empatam.'''
+    tol = instancia.tolerancia
+    z_RL, critico, _, corte, viavel = instancia.limitante()
+    if not viavel:
+        return {}, (-1., {})
+
+    # Solucao gulosa: os itens antes do corte e, na ordem por razao, cada
+    # item seguinte que ainda couber
+    sobra = instancia.capacidade - instancia.pesos_acumulados[corte]
+    valor = float(instancia.lucros_acumulados[corte])
+    sol: dict[int, float] = {i: 1 for i in instancia.ordem[:corte].tolist()}
+    for i in instancia.ordem[corte:].tolist():
+        if instancia.pesos[i] <= sobra:
             sol[i] = 1
-            vfobj += lucros[i]
-            b += pesos[i]
-        elif capacidade > b + tolerancia:
-            sol[i] = (capacidade-b)/pesos[i]
-            vfobj += lucros[i]*sol[i]
-            b = capacidade
-            break
-    
-    return vfobj, sol, bool(True)
+            sobra -= instancia.pesos[i]
+            valor += instancia.lucros[i]
+    incumbente = (valor, dict(sorted(sol.items())))
+
+    if critico == -1:
+        # a relaxacao da raiz ja e' inteira: todas as variaveis ficam fixas
+        dentro = set(instancia.ordem[:corte].tolist())
+        fixas = {i: int(i in dentro) for i in range(instancia.n)}
+        valor_RL = float(instancia.lucros_acumulados[corte])
+        return fixas, (valor_RL, {i: 1 for i in sorted(dentro)})
+
+    razao = instancia.lucros[critico] / instancia.pesos[critico]
+    custo_reduzido = np.abs(instancia.lucros - razao * instancia.pesos)
+    if np.all(np.mod(instancia.lucros, 1) == 0):
+        limiar = valor + 1 - tol
+    else:
+        limiar = valor + tol
+    fixavel = z_RL - custo_reduzido < limiar
+    fixavel[critico] = False
+
+    na_relaxacao = np.zeros(instancia.n, dtype=bool)
+    na_relaxacao[instancia.ordem[:corte]] = True
+    fixas = {int(i): int(na_relaxacao[i]) for i in np.flatnonzero(fixavel)}
+    return fixas, incumbente
+
+
+def relaxacao_linear_mochila_lote(lucros: np.ndarray,
+                                  pesos: np.ndarray,
+                                  capacidades: np.ndarray,
+                                  tolerancia: float = 1e-6
+                                  ) -> tuple[np.ndarray, np.ndarray, np.ndarray,
+                                             np.ndarray, np.ndarray]:
+    '''Relaxacao linear de varias instancias da mochila 0-1 de uma so vez.
+
+    `lucros` e `pesos` sao matrizes (instancias x itens) e `capacidades` um
+    vetor com uma capacidade por instancia. Retorna os vetores
+    `(limitantes, criticos, fracoes, solucoes, valores)`: o valor da
+    relaxacao, o item fracionario (-1 se nao houver) e o seu valor, a
+    matriz 0-1 da solucao gulosa inteira (os itens que cabem inteiros, na
+    ordem por razao) e o valor dessa solucao. Instancias com capacidade
+    negativa sao inviaveis e recebem limitante -inf.'''
+    lucros = np.atleast_2d(np.asarray(lucros, dtype=float))
+    pesos = np.atleast_2d(np.asarray(pesos, dtype=float))
+    capacidades = np.broadcast_to(
+        np.asarray(capacidades, dtype=float), (lucros.shape[0],))
+    num_instancias, n = lucros.shape
+    linhas = np.arange(num_instancias)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        razao = lucros / pesos
+    ordem = np.argsort(-razao, axis=1, kind='stable')
+    pesos_ordenados = np.take_along_axis(pesos, ordem, axis=1)
+    lucros_ordenados = np.take_along_axis(lucros, ordem, axis=1)
+    zeros = np.zeros((num_instancias, 1))
+    pesos_acumulados = np.concatenate(
+        (zeros, np.cumsum(pesos_ordenados, axis=1)), axis=1)
+    lucros_acumulados = np.concatenate(
+        (zeros, np.cumsum(lucros_ordenados, axis=1)), axis=1)
+
+    # numero de itens que cabem inteiros (as somas de prefixo sao crescentes)
+    corte = (pesos_acumulados[:, 1:] <= capacidades[:, None]).sum(axis=1)
+    valores = lucros_acumulados[linhas, corte]
+    sobra = capacidades - pesos_acumulados[linhas, corte]
+
+    posicao_critica = np.minimum(corte, n - 1)
+    tem_critico = (corte < n) & (sobra > tolerancia)
+    criticos = np.where(tem_critico, ordem[linhas, posicao_critica], -1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fracoes = np.where(
+            tem_critico, sobra / pesos_ordenados[linhas, posicao_critica], 0.)
+    limitantes = valores + fracoes * lucros_ordenados[linhas, posicao_critica]
+
+    viaveis = capacidades >= 0
+    limitantes = np.where(viaveis, limitantes, -np.inf)
+    criticos = np.where(viaveis, criticos, -1)
+    fracoes = np.where(viaveis, fracoes, 0.)
+
+    solucoes = np.zeros((num_instancias, n), dtype=np.int8)
+    np.put_along_axis(solucoes, ordem,
+                      (np.arange(n)[None, :] < corte[:, None]).astype(np.int8),
+                      axis=1)
+    return limitantes, criticos, fracoes, solucoes, valores
+
+
+class NoTrilha:
+    '''No da arvore de busca guardado como trilha: aponta para o no pai e
+    registra apenas a variavel fixada na ramificacao que o criou. As
+    fixacoes dos ancestrais sao compartilhadas, em vez de copiadas para
+    cada filho, e o dicionario completo so e' reconstruido ao desempilhar.'''
+    __slots__ = ('pai', 'var', 'val')
+
+    def __init__(self, pai: 'NoTrilha | None', var: int, val: int) -> None:
+        self.pai = pai
+        self.var = var
+        self.val = val
+
+
+def fixacoes(no: NoTrilha | None) -> dict[int, float]:
+    '''Reconstroi as variaveis fixas de um no, da raiz ate ele.'''
+    trilha: list[tuple[int, float]] = []
+    while no is not None:
+        trilha.append((no.var, no.val))
+        no = no.pai
+    return dict(reversed(trilha))
+
+
+class RegistroArvore:
+    '''Registro da arvore de busca desligado: apenas numera os nos.
+
+    Os registros identificam os nos por inteiros (a raiz e' o no 0) e
+    guardam uma aresta por ramificacao. O objeto `igraph.Graph` so e'
+    montado quando pedido, por `para_igraph`, depois da busca.'''
+    def __init__(self) -> None:
+        self.num_nos = 1
+
+    def ramo(self, pai: int, var: int, val: int) -> int:
+        '''Registra o filho de `pai` com `x_var = val` e retorna o seu id.'''
+        no = self.num_nos
+        self.num_nos += 1
+        return no
+
+    def fechar(self) -> None:
+        pass
+
+    def arestas(self) -> tuple[list[int], list[int], list[int]]:
+        '''Retorna os vetores (pais, variaveis, valores) dos nos 1, 2, ...'''
+        raise ValueError('A arvore de busca nao foi registrada.')
+
+    def para_igraph(self) -> ig.Graph:
+        pais, variaveis, valores = self.arestas()
+        arvore = ig.Graph(n=len(pais) + 1,
+                          edges=list(zip(pais, range(1, len(pais) + 1))))
+        arvore.vs['name'] = ['raiz'] + [
+            f'x_{var}={val}' for var, val in zip(variaveis, valores)]
+        return arvore
+
+
+class RegistroMemoria(RegistroArvore):
+    '''Guarda as arestas da arvore em vetores compactos de inteiros.'''
+    def __init__(self) -> None:
+        super().__init__()
+        self.pais = array('q')
+        self.variaveis = array('q')
+        self.valores = array('b')
+
+    def ramo(self, pai: int, var: int, val: int) -> int:
+        self.pais.append(pai)
+        self.variaveis.append(var)
+        self.valores.append(val)
+        return super().ramo(pai, var, val)
+
+    def arestas(self) -> tuple[list[int], list[int], list[int]]:
+        return self.pais.tolist(), self.variaveis.tolist(), self.valores.tolist()
+
+
+class RegistroArquivo(RegistroArvore):
+    '''Grava cada ramificacao como uma linha `pai var val` num arquivo
+    aberto apenas para acrescimo. A linha k descreve o no k.'''
+    def __init__(self, caminho: str) -> None:
+        super().__init__()
+        self.caminho = caminho
+        self.arquivo = open(caminho, 'w')
+
+    def ramo(self, pai: int, var: int, val: int) -> int:
+        self.arquivo.write(f'{pai} {var} {val}\n')
+        return super().ramo(pai, var, val)
+
+    def fechar(self) -> None:
+        self.arquivo.close()
+
+    def arestas(self) -> tuple[list[int], list[int], list[int]]:
+        if not self.arquivo.closed:
+            self.arquivo.flush()
+        return ler_registro(self.caminho)
+
+
+def ler_registro(caminho: str) -> tuple[list[int], list[int], list[int]]:
+    '''Le um registro gravado por `RegistroArquivo`.'''
+    pais: list[int] = []
+    variaveis: list[int] = []
+    valores: list[int] = []
+    with open(caminho) as arquivo:
+        for linha in arquivo:
+            pai, var, val = linha.split()
+            pais.append(int(pai))
+            variaveis.append(int(var))
+            valores.append(int(val))
+    return pais, variaveis, valores
+
+
+def criar_registro(modo: str, caminho: str | None = None) -> RegistroArvore:
+    '''Cria o registro da arvore para o modo 'nenhum', 'memoria' ou 'arquivo'.'''
+    if modo == 'nenhum':
+        return RegistroArvore()
+    if modo == 'memoria':
+        return RegistroMemoria()
+    if modo == 'arquivo':
+        if caminho is None:
+            raise ValueError('O modo arquivo exige o caminho do registro.')
+        return RegistroArquivo(caminho)
+    raise ValueError("registro deve ser 'nenhum', 'memoria' ou 'arquivo'.")
+
+
+class EstatisticasBaB:
+    '''Contadores de uma execucao do branch-and-bound.
+
+    `nos_processados` conta os nos cuja relaxacao foi resolvida. Os tempos
+    (em segundos) separam a relaxacao, a ramificacao (escolha da variavel,
+    heuristica e criacao dos filhos) e a manutencao da arvore (lista de
+    nos abertos e registro da arvore). `interrompido` indica que a busca
+    parou por um limite de nos ou de tempo antes de esgotar a arvore, e a
+    solucao devolvida pode nao ser otima.'''
+    def __init__(self) -> None:
+        self.nos_processados = 0
+        self.podados_por_limitante = 0
+        self.podados_inviaveis = 0
+        self.folhas_inteiras = 0
+        self.max_abertos = 0
+        self.fixadas_reducao = 0
+        self.tempo_relaxacao = 0.
+        self.tempo_ramificacao = 0.
+        self.tempo_arvore = 0.
+        self.interrompido = False
+
+    def somar(self, outra: 'EstatisticasBaB') -> None:
+        '''Acumula os contadores de outra execucao (por exemplo, de uma
+        tarefa do modo paralelo).'''
+        for nome, valor in vars(outra).items():
+            if nome == 'max_abertos':
+                self.max_abertos = max(self.max_abertos, valor)
+            elif nome == 'interrompido':
+                self.interrompido = self.interrompido or valor
+            else:
+                setattr(self, nome, getattr(self, nome) + valor)
+
+    def como_dict(self) -> dict[str, float]:
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        return '\n'.join(f'{nome}: {valor}' for nome, valor in vars(self).items())
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def _processar_no(instancia: InstanciaMochila,
+                  estatisticas: EstatisticasBaB,
+                  no: NoTrilha | None,
+                  variaveis_fixas: dict[int, float],
+                  incumbente: Callable[[], float],
+                  podar: Callable[[float], bool],
+                  atualizar: Callable[[float, dict[int, float], bool], None],
+                  verbose: bool = False
+                  ) -> tuple[float, tuple[NoTrilha, NoTrilha] | None]:
+    '''Processa um no retirado da lista de abertos, compartilhado pela busca
+    serial e pela paralela: resolve a relaxacao e poda o no se ela for
+    inviavel ou se `podar(z_RL)`. Uma folha inteira, ou a solucao obtida
+    zerando o item fracionario quando supera `incumbente()`, vai para
+    `atualizar(valor, solucao, folha)`. Acumula os contadores e os tempos
+    de relaxacao e ramificacao em `estatisticas`.
+
+    Retorna o valor da relaxacao e os filhos (x=0, x=1) a abrir, ou None
+    se o no nao deve ser ramificado.'''
+    tolerancia = instancia.tolerancia
+    inicio = time.perf_counter()
+    # Resolver a relaxacao do subproblema
+    z_RL, critico, fracao, corte, viavel_RL = instancia.limitante(variaveis_fixas)
+    fim_relaxacao = time.perf_counter()
+    estatisticas.tempo_relaxacao += fim_relaxacao - inicio
+    estatisticas.nos_processados += 1
+
+    # Se o subproblema e' inviavel, ignore-o e siga para o proximo
+    if not viavel_RL:
+        estatisticas.podados_inviaveis += 1
+        return z_RL, None
+    elif verbose:
+        print(instancia.solucao(variaveis_fixas, critico, fracao, corte))
+
+    # Se a relaxacao nao supera a incumbente, pode por nao-otimalidade
+    if podar(z_RL):
+        estatisticas.podados_por_limitante += 1
+        return z_RL, None
+
+    # A relaxacao gulosa tem no maximo uma variavel fracionaria: o item
+    # critico, quando ha' sobra de capacidade
+    if critico == -1 or not tolerancia < fracao < 1.0 - tolerancia:
+        # Se a solucao da relaxacao e' inteira, regozije-se!
+        estatisticas.folhas_inteiras += 1
+        sol_RL = instancia.solucao(variaveis_fixas, critico, fracao, corte)
+        atualizar(z_RL, sol_RL, True)
+        if verbose:
+            print(z_RL, sol_RL)
+        estatisticas.tempo_ramificacao += time.perf_counter() - fim_relaxacao
+        return z_RL, None
+
+    # Se a solucao nao e' inteira, siga dividindo. Zerar a unica variavel
+    # fracionaria produz uma solucao inteira viavel, que pode melhorar a
+    # incumbente e acentuar a poda
+    z_heuristica = z_RL - fracao*instancia.lucros[critico]
+    if z_heuristica > incumbente() + tolerancia:
+        atualizar(float(z_heuristica),
+                  instancia.solucao(variaveis_fixas, -1, 0., corte), False)
+    filhos = (NoTrilha(no, critico, 0), NoTrilha(no, critico, 1))
+    estatisticas.tempo_ramificacao += time.perf_counter() - fim_relaxacao
+    return z_RL, filhos
+
+
+SELECOES = ('profundidade', 'melhor_limitante', 'hibrida')
 
 
 def branch_and_bound_mochila(lucros: list[int] | list[float],
                              pesos: list[int] | list[float],
                              capacidade: int,
                              verbose: bool=False,
-                             tolerancia: float = 1e-6):
-    nome_raiz = 'raiz'
-    pilha: list[tuple[str, dict[int, float]]] = [ (nome_raiz, dict()) ]
+                             tolerancia: float = 1e-6,
+                             selecao: str = 'profundidade',
+                             registro: str = 'memoria',
+                             arquivo_registro: str | None = None,
+                             processos: int | None = None,
+                             profundidade_divisao: int = 8,
+                             limite_nos_tarefa: int = 10000,
+                             reduzir: bool = False,
+                             ao_melhorar: Callable[[float, dict[int, float]], None] | None = None,
+                             ao_progresso: Callable[[EstatisticasBaB], None] | None = None,
+                             intervalo_progresso: int = 1000,
+                             limite_nos: int | None = None,
+                             limite_tempo: float | None = None):
+    '''Branch-and-bound para o problema da mochila 0-1.
+
+    `selecao` define a ordem de exploracao dos nos abertos:
+    'profundidade' (pilha), 'melhor_limitante' (heap pelo limitante da
+    relaxacao do no pai) ou 'hibrida' (mergulha em profundidade ate a
+    primeira folha inteira e depois segue pelo melhor limitante). Nos cujo
+    limitante nao supera a incumbente sao podados.
+
+    A arvore de busca e' registrada conforme `registro`: 'nenhum',
+    'memoria' (vetores de inteiros) ou 'arquivo' (log gravado em
+    `arquivo_registro` durante a busca). O registro retornado monta o
+    `igraph.Graph` com `para_igraph()`.
+
+    Com `processos` > 1 a busca e' feita em paralelo: a arvore e' dividida
+    na profundidade `profundidade_divisao` e as subarvores sao resolvidas
+    por um `ProcessPoolExecutor`, que compartilha o valor da incumbente
+    entre os processos. Uma tarefa que processa mais de `limite_nos_tarefa`
+    nos devolve os nos ainda abertos, que viram novas tarefas. O resultado
+    e' o mesmo da busca serial em profundidade; a arvore nao e' registrada.
+
+    Com `reduzir`, as variaveis fixadas por `reducao_mochila` saem do
+    problema antes da busca, que e' feita apenas sobre os itens restantes
+    (o nucleo); nesse caso a arvore registrada usa os indices do nucleo.
+
+    `ao_melhorar(valor, solucao)` e' chamada a cada nova incumbente (no
+    modo paralelo, apenas com a solucao final), e `ao_progresso` recebe as
+    estatisticas a cada `intervalo_progresso` nos processados (no modo
+    paralelo, a cada tarefa concluida).
+
+    A busca para apos `limite_nos` nos processados ou `limite_tempo`
+    segundos, devolvendo a melhor solucao encontrada ate entao com
+    `estatisticas.interrompido` verdadeiro (no modo paralelo, cada tarefa
+    recebe uma parte dos nos que restam e o prazo comum).
+
+    Retorna `(melhor, arvore, estatisticas)`.'''
+    if selecao not in SELECOES:
+        raise ValueError(f'selecao deve ser uma de {SELECOES}.')
+    prazo = None if limite_tempo is None else time.perf_counter() + limite_tempo
+    if reduzir:
+        fixas, incumbente = reducao_mochila(
+            InstanciaMochila(lucros, pesos, capacidade, tolerancia))
+        nucleo = [i for i in range(len(lucros)) if i not in fixas]
+        if verbose:
+            print(f'reducao: {len(fixas)} de {len(lucros)} variaveis fixadas')
+        em_1 = [i for i, val in fixas.items() if val == 1]
+        lucro_fixo = sum(lucros[i] for i in em_1)
+
+        def completar(melhor_nucleo: tuple[float, dict[int, float]]
+                      ) -> tuple[float, dict[int, float]]:
+            '''Traduz uma solucao do nucleo para o problema original.'''
+            sol = {i: 1 for i in em_1}
+            sol.update({nucleo[j]: val for j, val in melhor_nucleo[1].items()})
+            return float(melhor_nucleo[0] + lucro_fixo), dict(sorted(sol.items()))
+
+        def ao_melhorar_nucleo(valor: float, sol: dict[int, float]):
+            if ao_melhorar is not None and valor + lucro_fixo > incumbente[0] + tolerancia:
+                ao_melhorar(*completar((valor, sol)))
+
+        if ao_melhorar is not None:
+            ao_melhorar(*incumbente)
+        melhor_nucleo, arvore, estatisticas = branch_and_bound_mochila(
+            [lucros[i] for i in nucleo], [pesos[i] for i in nucleo],
+            capacidade - sum(pesos[i] for i in em_1),
+            verbose, tolerancia, selecao, registro, arquivo_registro,
+            processos, profundidade_divisao, limite_nos_tarefa,
+            ao_melhorar=ao_melhorar_nucleo,
+            ao_progresso=ao_progresso,
+            intervalo_progresso=intervalo_progresso,
+            limite_nos=limite_nos,
+            limite_tempo=None if prazo is None else prazo - time.perf_counter())
+        estatisticas.fixadas_reducao = len(fixas)
+        if melhor_nucleo[0] + lucro_fixo > incumbente[0] + tolerancia:
+            return completar(melhor_nucleo), arvore, estatisticas
+        return incumbente, arvore, estatisticas
+    if processos is not None and processos > 1:
+        melhor, estatisticas = _branch_and_bound_paralelo(
+            InstanciaMochila(lucros, pesos, capacidade, tolerancia),
+            processos, profundidade_divisao, limite_nos_tarefa, ao_progresso,
+            limite_nos, prazo)
+        if ao_melhorar is not None:
+            ao_melhorar(*melhor)
+        return melhor, RegistroArvore(), estatisticas
+
+    # nos abertos: (limitante do no pai, id do no, trilha de fixacoes)
+    pilha: list[tuple[float, int, NoTrilha | None]] = []
+    heap: list[tuple[float, int, int, NoTrilha | None]] = []
+    contador = 0 # desempate do heap, preserva a ordem de insercao
+    usar_heap = selecao == 'melhor_limitante'
     melhor: tuple[float, dict[int, float]] = (-1., {})
-    arvore = ig.Graph(1)
-    arvore.vs[0]['name'] = nome_raiz
+    arvore = criar_registro(registro, arquivo_registro)
+    estatisticas = EstatisticasBaB()
+    # ordenacao e somas de prefixo calculadas uma unica vez
+    instancia = InstanciaMochila(lucros, pesos, capacidade, tolerancia)
 
-    while len(pilha) > 0:
+    def abrir(limitante_pai: float, id_no: int, no: NoTrilha | None):
+        nonlocal contador
+        if usar_heap:
+            heapq.heappush(heap, (-limitante_pai, contador, id_no, no))
+            contador += 1
+        else:
+            pilha.append((limitante_pai, id_no, no))
+
+    def atualizar_incumbente(valor: float, sol: dict[int, float], folha: bool):
+        nonlocal melhor, usar_heap
+        melhor = (valor, sol)
+        if ao_melhorar is not None:
+            ao_melhorar(valor, sol)
+        # so' uma folha inteira encerra o mergulho; a heuristica de
+        # arredondamento ja' da' uma incumbente na raiz
+        if folha and selecao == 'hibrida' and not usar_heap:
+            # fim do mergulho: os nos abertos passam para o heap
+            usar_heap = True
+            for aberto in pilha:
+                abrir(*aberto)
+            pilha.clear()
+
+    def podar(limitante: float) -> bool:
+        return limitante <= melhor[0] + tolerancia
+
+    abrir(float('inf'), 0, None)
+    while len(pilha) > 0 or len(heap) > 0:
+        if (limite_nos is not None and estatisticas.nos_processados >= limite_nos) \
+                or (prazo is not None and time.perf_counter() >= prazo):
+            estatisticas.interrompido = True
+            break
+        estatisticas.max_abertos = max(estatisticas.max_abertos,
+                                       len(pilha) + len(heap))
+        inicio = time.perf_counter()
         # Obter o problema subproblema a ser resolvido
-        nome_no_anterior, variaveis_fixas = pilha.pop()
-
-        # Resolver a relaxacao do subproblema
-        z_RL, sol_RL, viavel_RL = relaxacao_linear_mochila(lucros, pesos, capacidade, 
-            variaveis_fixas,tolerancia)
-        
-        # Se o subproblema e' inviavel, ignore-o e siga para o proximo
-        if not viavel_RL:
-            continue
-        elif verbose: 
-            print(sol_RL)
+        if usar_heap:
+            menos_limitante_pai, _, id_no_anterior, no = heapq.heappop(heap)
+            limitante_pai = -menos_limitante_pai
+        else:
+            limitante_pai, id_no_anterior, no = pilha.pop()
+        fim_arvore = time.perf_counter()
+        estatisticas.tempo_arvore += fim_arvore - inicio
 
-        # Detectar se existe alguma variavel com valor fracionario
-        variavel_de_ramificacao = -1
-        for i in range(len(lucros)):
-            if i in sol_RL and tolerancia < sol_RL[i] < 1.0 - tolerancia:
-                variavel_de_ramificacao = i
-                break
+        # Poda pelo limitante do pai, antes mesmo de resolver a relaxacao
+        if podar(limitante_pai):
+            estatisticas.podados_por_limitante += 1
+            continue
+        z_RL, filhos = _processar_no(
+            instancia, estatisticas, no, fixacoes(no), lambda: melhor[0], podar,
+            atualizar_incumbente, verbose)
+        if ao_progresso is not None and \
+                estatisticas.nos_processados % intervalo_progresso == 0:
+            ao_progresso(estatisticas)
+        if filhos is None:
+            continue
 
-        # Se a solucao da relaxacao e' inteira, regozije-se!
-        if variavel_de_ramificacao == -1:
-            if z_RL > melhor[0]:
-                melhor = (z_RL, sol_RL)
-            if verbose:
-                print(z_RL, sol_RL)
-
-        else: # Se a solucao nao e' inteira, siga dividindo
-            fixa_em_0 = dict(variaveis_fixas)
-            fixa_em_0[variavel_de_ramificacao] = 0
-
-            nome_no_atual = f'x_{variavel_de_ramificacao}=0'
-            arvore.add_vertex(nome_no_atual)
-            arvore.add_edge(nome_no_anterior, nome_no_atual)
-            # Anexar à lista de subproblemas a resolver
-            pilha.append((nome_no_atual, fixa_em_0))
-
-            fixa_em_1 = dict(variaveis_fixas)
-            fixa_em_1[variavel_de_ramificacao] = 1
-            
-            nome_no_atual = f'x_{variavel_de_ramificacao}=1'
-            arvore.add_vertex(nome_no_atual)
-            arvore.add_edge(nome_no_anterior, nome_no_atual)
-            pilha.append((nome_no_atual, fixa_em_1))
+        inicio = time.perf_counter()
+        # Anexar à lista de subproblemas a resolver
+        for filho in filhos:
+            id_no_atual = arvore.ramo(id_no_anterior, filho.var, filho.val)
+            abrir(z_RL, id_no_atual, filho)
+        estatisticas.tempo_arvore += time.perf_counter() - inicio
     
-    return melhor, arvore
+    arvore.fechar()
+    return melhor, arvore, estatisticas
+
+def branch_and_bound_mochila_lote(lucros: np.ndarray,
+                                  pesos: np.ndarray,
+                                  capacidades: np.ndarray,
+                                  tolerancia: float = 1e-6,
+                                  **opcoes) -> list[tuple[float, dict[int, float]]]:
+    '''Resolve varias instancias da mochila 0-1, uma por linha de `lucros`
+    e `pesos`.
+
+    As relaxacoes das raizes sao resolvidas juntas por
+    `relaxacao_linear_mochila_lote`; as instancias cuja raiz ja e' inteira
+    ficam resolvidas sem busca, e as demais vao para
+    `branch_and_bound_mochila`, que recebe as `opcoes` restantes (por
+    padrao sem registro da arvore). Retorna a melhor solucao de cada
+    instancia.'''
+    lucros = np.atleast_2d(np.asarray(lucros))
+    pesos = np.atleast_2d(np.asarray(pesos))
+    capacidades = np.broadcast_to(np.asarray(capacidades), (lucros.shape[0],))
+    opcoes.setdefault('registro', 'nenhum')
+
+    _, criticos, fracoes, solucoes, valores = relaxacao_linear_mochila_lote(
+        lucros, pesos, capacidades, tolerancia)
+    inteiras = (criticos == -1) | (fracoes <= tolerancia) | (fracoes >= 1.0 - tolerancia)
+
+    resultados: list[tuple[float, dict[int, float]]] = []
+    for k in range(lucros.shape[0]):
+        if capacidades[k] < 0:
+            resultados.append((-1., {}))
+        elif inteiras[k]:
+            sol: dict[int, float] = {int(i): 1 for i in np.flatnonzero(solucoes[k])}
+            valor = float(valores[k])
+            if criticos[k] != -1:
+                sol[int(criticos[k])] = float(fracoes[k])
+                valor += float(fracoes[k] * lucros[k, criticos[k]])
+            resultados.append((valor, sol))
+        else:
+            melhor, _, _ = branch_and_bound_mochila(
+                lucros[k].tolist(), pesos[k].tolist(), capacidades[k].item(),
+                tolerancia=tolerancia, **opcoes)
+            resultados.append(melhor)
+    return resultados
+
+
+def programacao_dinamica_mochila(lucros: list[int] | list[float],
+                                 pesos: list[int],
+                                 capacidade: int,
+                                 memoria_maxima: int = 2**28):
+    '''Resolve a mochila 0-1 de pesos inteiros por programacao dinamica em
+    O(n C), com o mesmo formato de retorno de `branch_and_bound_mochila`.
+
+    A tabela e' um unico vetor de C+1 posicoes atualizado item a item com
+    operacoes do NumPy. Para reconstruir a solucao guardam-se, compactados
+    em bits, os itens escolhidos em cada capacidade. Se esses bits nao
+    couberem em `memoria_maxima` bytes, guardam-se apenas copias da tabela
+    no inicio de cada bloco de itens, e os bits de cada bloco sao
+    recalculados durante a reconstrucao.'''
+    lucros_ = np.asarray(lucros, dtype=float)
+    pesos_ = np.asarray(pesos, dtype=np.int64)
+    n = len(lucros_)
+    if capacidade < 0:
+        return (-1., {}), RegistroArvore(), EstatisticasBaB()
+    C = int(capacidade)
+
+    def avancar(tabela: np.ndarray, i: int) -> tuple[np.ndarray, np.ndarray]:
+        '''Inclui o item i na tabela; retorna a nova tabela e os bits de
+        escolha do item em cada capacidade.'''
+        w, p = int(pesos_[i]), lucros_[i]
+        nova = tabela.copy()
+        escolhe = np.zeros(C + 1, dtype=bool)
+        if w <= C:
+            candidato = tabela[:C + 1 - w] + p
+            escolhe[w:] = candidato > tabela[w:]
+            nova[w:] = np.where(escolhe[w:], candidato, tabela[w:])
+        return nova, np.packbits(escolhe)
+
+    tamanho_bits = (C + 8) // 8
+    if n * tamanho_bits <= memoria_maxima:
+        tamanho_bloco = max(n, 1)
+    else:
+        # blocos de ~8 sqrt(n) itens equilibram as copias da tabela
+        # (8 bytes por posicao) e os bits de um bloco (1/8 de byte)
+        tamanho_bloco = max(1, int(np.ceil(8 * np.sqrt(n))))
+
+    tabela = np.zeros(C + 1)
+    inicios = list(range(0, n, tamanho_bloco))
+    tabelas_iniciais: list[np.ndarray] = []
+    bits: list[np.ndarray] = []
+    for inicio in inicios:
+        tabelas_iniciais.append(tabela)
+        bits = []
+        for i in range(inicio, min(inicio + tamanho_bloco, n)):
+            tabela, escolhas = avancar(tabela, i)
+            bits.append(escolhas)
+    valor = float(tabela[C])
+
+    sol: dict[int, float] = dict()
+    c = C
+    for k in reversed(range(len(inicios))):
+        inicio = inicios[k]
+        if k < len(inicios) - 1:
+            # os bits do ultimo bloco ficaram da passada de ida
+            tabela = tabelas_iniciais[k]
+            bits = []
+            for i in range(inicio, min(inicio + tamanho_bloco, n)):
+                tabela, escolhas = avancar(tabela, i)
+                bits.append(escolhas)
+        for i in reversed(range(inicio, min(inicio + tamanho_bloco, n))):
+            if (bits[i - inicio][c >> 3] >> (7 - (c & 7))) & 1:
+                sol[i] = 1
+                c -= int(pesos_[i])
+
+    return (valor, dict(sorted(sol.items()))), RegistroArvore(), EstatisticasBaB()
+
+
+# Limite de n*(C+1) ate o qual a programacao dinamica e' preferida
+LIMITE_PROGRAMACAO_DINAMICA = 2 * 10**8
+BACKENDS = ('auto', 'branch_and_bound', 'programacao_dinamica')
+
+
+def resolver_mochila(lucros: list[int] | list[float],
+                     pesos: list[int] | list[float],
+                     capacidade: int | float,
+                     backend: str = 'auto',
+                     **opcoes):
+    '''Resolve a mochila 0-1 pelo metodo indicado em `backend`.
+
+    Com 'auto', a programacao dinamica e' usada quando os pesos e a
+    capacidade sao inteiros nao negativos e n*(C+1) nao passa de
+    `LIMITE_PROGRAMACAO_DINAMICA`; caso contrario, o branch-and-bound. As
+    `opcoes` vao para o metodo escolhido; com 'auto', as que o metodo
+    escolhido nao aceita sao ignoradas, de modo que a mesma chamada serve
+    para os dois. Retorna `(melhor, arvore, estatisticas)`.'''
+    if backend not in BACKENDS:
+        raise ValueError(f'backend deve ser um de {BACKENDS}.')
+    automatico = backend == 'auto'
+    if automatico:
+        pesos_ = np.asarray(pesos)
+        inteiros = (np.issubdtype(pesos_.dtype, np.integer)
+                    or bool(np.all(np.mod(pesos_, 1) == 0))) \
+            and float(capacidade).is_integer()
+        backend = 'branch_and_bound'
+        if inteiros and capacidade >= 0 and np.all(pesos_ >= 0) \
+                and len(pesos_) * (capacidade + 1) <= LIMITE_PROGRAMACAO_DINAMICA:
+            backend = 'programacao_dinamica'
+
+    metodo = programacao_dinamica_mochila if backend == 'programacao_dinamica' \
+        else branch_and_bound_mochila
+    if automatico:
+        aceitas = inspect.signature(metodo).parameters
+        opcoes = {nome: valor for nome, valor in opcoes.items() if nome in aceitas}
+    if backend == 'programacao_dinamica':
+        return programacao_dinamica_mochila(
+            lucros, np.asarray(pesos).astype(np.int64).tolist(),
+            int(capacidade), **opcoes)
+    return branch_and_bound_mochila(lucros, pesos, capacidade, **opcoes)
+
+
+# Subarvore aberta no modo paralelo: (caminho, limitante do no pai,
+# variaveis fixas). O caminho registra as escolhas desde a raiz, 0 para o
+# filho x=1 e 1 para o filho x=0, que e' a ordem em que a busca serial em
+# profundidade os visita; assim a ordem lexicografica dos caminhos e' a
+# ordem da busca serial.
+Subarvore = tuple[tuple[int, ...], float, dict[int, float]]
+Candidata = tuple[float, tuple[int, ...], dict[int, float]]
+
+# Estado de cada processo trabalhador, criado uma unica vez por
+# `_inicializar_trabalhador`.
+_instancia_trabalhador: InstanciaMochila | None = None
+_incumbente_compartilhado = None
+
+
+def _explorar(instancia: InstanciaMochila,
+              abertos: list[Subarvore],
+              incumbente,
+              limite_nos: int | None = None,
+              profundidade_max: int | None = None,
+              prazo: float | None = None
+              ) -> tuple[Candidata, list[Subarvore], EstatisticasBaB]:
+    '''Busca em profundidade a partir dos nos `abertos`.
+
+    `incumbente` e' um `multiprocessing.Value` com o melhor valor conhecido
+    por todos os processos. Um no e' podado se o seu limitante nao supera a
+    incumbente local ou fica abaixo da compartilhada; empates com a
+    compartilhada nao sao podados, para que cada subarvore encontre a mesma
+    solucao que a busca serial encontraria nela. A busca para apos
+    `limite_nos` nos ou no instante `prazo` (de `time.perf_counter`), e nos
+    de profundidade `profundidade_max` nao sao resolvidos. Retorna a melhor
+    solucao encontrada, os nos que ficaram abertos, na ordem da busca
+    serial, e as estatisticas da busca.'''
+    tol = instancia.tolerancia
+    estatisticas = EstatisticasBaB()
+    melhor: Candidata = (-1., (), {})
+    # (indice da subarvore de origem, limitante do pai, trilha)
+    pilha: list[tuple[int, float, NoTrilha | None]] = [
+        (k, limitante, None) for k, (_, limitante, _) in reversed(list(enumerate(abertos)))]
+    restantes: list[Subarvore] = []
+
+    def podar(limitante: float) -> bool:
+        return limitante <= melhor[0] + tol or limitante < incumbente.value - tol
+
+    def caminho(k: int, no: NoTrilha | None) -> tuple[int, ...]:
+        escolhas: list[int] = []
+        while no is not None:
+            escolhas.append(1 - no.val)
+            no = no.pai
+        return abertos[k][0] + tuple(reversed(escolhas))
+
+    def atualizar(valor: float, k: int, no: NoTrilha | None, sol: dict[int, float]):
+        nonlocal melhor
+        melhor = (valor, caminho(k, no), sol)
+        with incumbente.get_lock():
+            if valor > incumbente.value:
+                incumbente.value = valor
+
+    while len(pilha) > 0:
+        if limite_nos is not None and estatisticas.nos_processados >= limite_nos:
+            break
+        if prazo is not None and time.perf_counter() >= prazo:
+            break
+        estatisticas.max_abertos = max(estatisticas.max_abertos, len(pilha))
+        inicio = time.perf_counter()
+        k, limitante_pai, no = pilha.pop()
+        fim_arvore = time.perf_counter()
+        estatisticas.tempo_arvore += fim_arvore - inicio
+        if podar(limitante_pai):
+            estatisticas.podados_por_limitante += 1
+            continue
+        trilha = fixacoes(no)
+        variaveis_fixas = dict(abertos[k][2])
+        variaveis_fixas.update(trilha)
+        if profundidade_max is not None and \
+                len(abertos[k][0]) + len(trilha) >= profundidade_max:
+            restantes.append((caminho(k, no), limitante_pai, variaveis_fixas))
+            continue
+
+        z_RL, filhos = _processar_no(
+            instancia, estatisticas, no, variaveis_fixas, lambda: melhor[0], podar,
+            lambda valor, sol, _: atualizar(valor, k, no, sol))
+        if filhos is not None:
+            inicio = time.perf_counter()
+            for filho in filhos:
+                pilha.append((k, z_RL, filho))
+            estatisticas.tempo_arvore += time.perf_counter() - inicio
+
+    for k, limitante_pai, no in reversed(pilha):
+        variaveis_fixas = dict(abertos[k][2])
+        variaveis_fixas.update(fixacoes(no))
+        restantes.append((caminho(k, no), limitante_pai, variaveis_fixas))
+    return melhor, restantes, estatisticas
+
+
+def _inicializar_trabalhador(lucros, pesos, capacidade, tolerancia, incumbente):
+    global _instancia_trabalhador, _incumbente_compartilhado
+    _instancia_trabalhador = InstanciaMochila(lucros, pesos, capacidade, tolerancia)
+    _incumbente_compartilhado = incumbente
+
+
+def _explorar_tarefa(subarvore: Subarvore, limite_nos: int,
+                     prazo_relogio: float | None
+                     ) -> tuple[Candidata, list[Subarvore], EstatisticasBaB]:
+    assert _instancia_trabalhador is not None
+    # o prazo chega em `time.time`, o unico relogio comum aos processos
+    prazo = None if prazo_relogio is None \
+        else time.perf_counter() + (prazo_relogio - time.time())
+    return _explorar(_instancia_trabalhador, [subarvore],
+                     _incumbente_compartilhado, limite_nos, prazo=prazo)
+
+
+def _preferir(atual: Candidata, candidata: Candidata, tolerancia: float) -> Candidata:
+    '''Escolhe a solucao que a busca serial em profundidade manteria: a de
+    maior valor e, em caso de empate, a encontrada primeiro.'''
+    if candidata[0] > atual[0] + tolerancia:
+        return candidata
+    if candidata[0] >= atual[0] - tolerancia and candidata[1] < atual[1]:
+        return candidata
+    return atual
+
+
+def _branch_and_bound_paralelo(instancia: InstanciaMochila,
+                               processos: int,
+                               profundidade_divisao: int,
+                               limite_nos_tarefa: int,
+                               ao_progresso: Callable[[EstatisticasBaB], None] | None = None,
+                               limite_nos: int | None = None,
+                               prazo: float | None = None
+                               ) -> tuple[tuple[float, dict[int, float]], EstatisticasBaB]:
+    incumbente = mp.Value('d', -1.)
+    # Os niveis mais rasos sao resolvidos aqui; os nos na profundidade de
+    # divisao sao as tarefas iniciais
+    melhor, abertos, estatisticas = _explorar(
+        instancia, [((), float('inf'), {})], incumbente, limite_nos,
+        profundidade_max=profundidade_divisao, prazo=prazo)
+
+    # subarvores a agendar e, para cada tarefa em andamento, os nos que ela
+    # pode processar; reservar esses nos mantem o limite de nos exato
+    espera = list(abertos)
+    reservados: dict = {}
+    prazo_relogio = None if prazo is None else time.time() + (prazo - time.perf_counter())
+
+    def agendar(executor):
+        while len(espera) > 0:
+            limite = limite_nos_tarefa
+            if limite_nos is not None:
+                limite = min(limite, limite_nos - estatisticas.nos_processados
+                             - sum(reservados.values()))
+            if limite <= 0 or (prazo is not None and time.perf_counter() >= prazo):
+                return
+            tarefa = executor.submit(_explorar_tarefa, espera.pop(), limite,
+                                     prazo_relogio)
+            reservados[tarefa] = limite
+
+    with ProcessPoolExecutor(
+            processos,
+            initializer=_inicializar_trabalhador,
+            initargs=(instancia.lucros, instancia.pesos, instancia.capacidade,
+                      instancia.tolerancia, incumbente)) as executor:
+        agendar(executor)
+        while len(reservados) > 0:
+            prontas, _ = wait(reservados, return_when=FIRST_COMPLETED)
+            for tarefa in prontas:
+                del reservados[tarefa]
+                candidata, restantes, estatisticas_tarefa = tarefa.result()
+                melhor = _preferir(melhor, candidata, instancia.tolerancia)
+                estatisticas.somar(estatisticas_tarefa)
+                if ao_progresso is not None:
+                    ao_progresso(estatisticas)
+                # Subarvores grandes sao redivididas: cada no que ficou
+                # aberto volta para a fila como uma nova tarefa
+                espera.extend(restantes)
+            agendar(executor)
+    estatisticas.interrompido = len(espera) > 0
+
+    return (melhor[0], melhor[2]), estatisticas
+
 
 def main():
     # Exemplo de problema da mochila 0-1
@@ -118,10 +1011,12 @@ def main():
     P = [5, 8, 3, 5, 3]
     C = 12
 
-    melhor, arvore = branch_and_bound_mochila(L, P, C, verbose=True)
+    melhor, arvore, estatisticas = branch_and_bound_mochila(L, P, C, verbose=True)
     print('melhor:\nobj: {}\nsolução: {}'.format(
         *melhor))
+    print(estatisticas)
     
+    arvore = arvore.para_igraph()
     fig, ax = plt.subplots()
     ig.plot(arvore, 
             target=ax, 
@@ -0,0 +1,114 @@
+import heapq
+from typing import Sequence
+
+# Separation of valid inequalities for the vertex cover polytope, given an
+# LP solution x:
+# - odd cycle: for an odd cycle C, x(C) >= (|C| + 1) / 2. With edge weights
+#   x_u + x_v - 1 >= 0 the weight of C is 2 x(C) - |C|, so C is violated
+#   when its weight is below 1. The lightest odd closed walk through v is a
+#   shortest path from (v, 0) to (v, 1) in the bipartite double cover
+#   (vertices (u, parity), every edge flips the parity);
+# - clique: for a clique K, x(K) >= |K| - 1, violated when the sum of
+#   1 - x_v over K exceeds 1. Cliques are grown greedily from vertices of
+#   small value.
+# A cut is returned as (vertices, right-hand side) of sum(x_v) >= rhs.
+
+Cut = tuple[tuple[int, ...], float]
+
+# Minimum violation of a returned cut
+VIOLATION = 1e-4
+
+
+def _simple_odd_cycle(walk: list[int]) -> list[int]:
+    """Extracts a simple odd cycle from a closed walk with an odd number of
+    edges (walk[0] == walk[-1]). With nonnegative weights, it is no heavier
+    than the walk."""
+    while True:
+        seen: dict[int, int] = {}
+        for i, v in enumerate(walk[:-1]):
+            if v in seen:
+                j = seen[v]
+                # split into the closed walks walk[j..i] and the rest; one of
+                # them has an odd number of edges
+                walk = walk[j:i + 1] if (i - j) % 2 == 1 else walk[:j] + walk[i:]
+                break
+            seen[v] = i
+        else:
+            return walk[:-1]
+
+
+def separate_odd_cycles(adjacency: Sequence[Sequence[int]],
+                        values: Sequence[float],
+                        max_cuts: int = 50) -> list[Cut]:
+    """Violated odd-cycle inequalities, at most one through each fractional
+    vertex, found by Dijkstra on the bipartite double cover restricted to
+    edges lighter than 1."""
+    cuts: list[Cut] = []
+    found: set[frozenset[int]] = set()
+    covered: set[int] = set()
+    sources = [v for v, value in enumerate(values) if VIOLATION < value < 1 - VIOLATION]
+    for source in sources:
+        if len(cuts) >= max_cuts:
+            break
+        if source in covered:
+            continue
+        target = (source, 1)
+        distance = {(source, 0): 0.}
+        previous: dict[tuple[int, int], tuple[int, int]] = {}
+        heap = [(0., source, 0)]
+        while len(heap) > 0:
+            d, u, parity = heapq.heappop(heap)
+            if (u, parity) == target:
+                break
+            if d > distance[(u, parity)]:
+                continue
+            for v in adjacency[u]:
+                node = (v, 1 - parity)
+                # walks of weight 1 or more are never violated: cut them off
+                candidate = d + max(values[u] + values[v] - 1, 0.)
+                if candidate < distance.get(node, 1 - VIOLATION):
+                    distance[node] = candidate
+                    previous[node] = (u, parity)
+                    heapq.heappush(heap, (candidate, v, 1 - parity))
+        if target not in previous:
+            continue
+
+        walk = [source]
+        node = target
+        while node != (source, 0):
+            node = previous[node]
+            walk.append(node[0])
+        cycle = _simple_odd_cycle(walk)
+        rhs = (len(cycle) + 1) / 2
+        key = frozenset(cycle)
+        if key not in found and sum(values[v] for v in cycle) < rhs - VIOLATION:
+            found.add(key)
+            covered.update(cycle)
+            cuts.append((tuple(cycle), rhs))
+    return cuts
+
+
+def separate_cliques(adjacency: Sequence[set[int]],
+                     values: Sequence[float],
+                     max_cuts: int = 50) -> list[Cut]:
+    """Violated clique inequalities, grown greedily from each fractional
+    vertex by adding the common neighbour of smallest value."""
+    cuts: list[Cut] = []
+    found: set[frozenset[int]] = set()
+    seeds = sorted((v for v, value in enumerate(values)
+                    if VIOLATION < value < 1 - VIOLATION), key=lambda v: values[v])
+    for seed in seeds:
+        if len(cuts) >= max_cuts:
+            break
+        clique = [seed]
+        candidates = set(adjacency[seed])
+        while len(candidates) > 0:
+            v = min(candidates, key=lambda u: (values[u], u))
+            clique.append(v)
+            candidates &= adjacency[v]
+        slack = sum(1 - values[v] for v in clique)
+        key = frozenset(clique)
+        if slack > 1 + VIOLATION and key not in found:
+            found.add(key)
+            cuts.append((tuple(sorted(clique)), float(len(clique) - 1)))
+    return cuts
@@ -0,0 +1,108 @@
+import gzip
+import os
+
+import igraph as ig
+import numpy as np
+
+# Graph files are read line by line, in chunks, into a deduplicated (m, 2)
+# edge array with u < v, which the solvers consume directly. Supported:
+# - DIMACS .clq/.col: "c" comments, "p edge N M" and 1-based "e u v" lines;
+# - plain edge lists: 0-based "u v" lines (extra columns, such as weights,
+#   are ignored), with "#" or "%" comments.
+# Leading whitespace is ignored, and a line that fits neither format is an
+# error. Files ending in .gz are decompressed on the fly.
+
+CHUNK_LINES = 1 << 20
+# First characters of a comment line, in either format
+COMMENTS = ('c', '#', '%')
+
+
+def _open(path: str | os.PathLike):
+    if os.fspath(path).endswith('.gz'):
+        return gzip.open(path, 'rt')
+    return open(path)
+
+
+def deduplicate_edges(edges: np.ndarray, n: int) -> np.ndarray:
+    """Orders every edge as (min, max), drops self-loops and repeated edges.
+
+    Returns:
+        np.ndarray: The (m, 2) int64 edge array, sorted.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    u = np.minimum(edges[:, 0], edges[:, 1])
+    v = np.maximum(edges[:, 0], edges[:, 1])
+    keys = np.unique(u[u != v] * n + v[u != v])
+    return np.stack((keys // n, keys % n), axis=1)
+
+
+def read_edges(path: str | os.PathLike, chunk_lines: int = CHUNK_LINES
+               ) -> tuple[int, np.ndarray]:
+    """Reads a DIMACS or edge-list file (see the module comment).
+
+    Args:
+        path (str | os.PathLike): The file, possibly gzipped.
+        chunk_lines (int, optional): Lines parsed per NumPy conversion.
+        Defaults to CHUNK_LINES.
+
+    Returns:
+        tuple[int, np.ndarray]: The number of vertices (from the "p" line,
+        or the largest id plus one) and the deduplicated 0-based edge array.
+
+    Raises:
+        ValueError: On a malformed line, with its line number, or a vertex
+        out of range.
+    """
+    n: int | None = None
+    dimacs = False
+    chunks: list[np.ndarray] = []
+    tokens: list[str] = []
+
+    def flush():
+        if len(tokens) > 0:
+            chunks.append(np.array(tokens, dtype=np.int64).reshape(-1, 2))
+            tokens.clear()
+
+    with _open(path) as file:
+        for count, line in enumerate(file):
+            fields = line.split()
+            if len(fields) == 0 or fields[0][0] in COMMENTS:
+                pass
+            elif fields[0] == 'p':
+                if len(fields) < 3:
+                    raise ValueError(f'{os.fspath(path)}:{count + 1}: '
+                                     'expected "p edge N M".')
+                n = int(fields[2])
+                dimacs = True
+            elif fields[0] == 'e':
+                if len(fields) < 3:
+                    raise ValueError(f'{os.fspath(path)}:{count + 1}: '
+                                     'expected "e u v".')
+                tokens.extend(fields[1:3])
+            elif fields[0].isdigit():
+                if len(fields) < 2:
+                    raise ValueError(f'{os.fspath(path)}:{count + 1}: '
+                                     'expected "u v".')
+                tokens.extend(fields[:2])
+            else:
+                raise ValueError(f'{os.fspath(path)}:{count + 1}: '
+                                 f'unexpected line {line.strip()!r}.')
+            if count % chunk_lines == chunk_lines - 1:
+                flush()
+    flush()
+
+    edges = np.concatenate(chunks) if len(chunks) > 0 \
+        else np.empty((0, 2), dtype=np.int64)
+    if dimacs:
+        edges -= 1
+    if n is None:
+        n = int(edges.max()) + 1 if len(edges) > 0 else 0
+    if len(edges) > 0 and (edges.min() < 0 or edges.max() >= n):
+        raise ValueError(f'{os.fspath(path)}: vertex out of range.')
+    return n, deduplicate_edges(edges, max(n, 1))
+
+
+def read_graph(path: str | os.PathLike) -> ig.Graph:
+    "Reads a graph file (see `read_edges`) into an ig.Graph."
+    n, edges = read_edges(path)
+    return ig.Graph(n, edges.tolist())
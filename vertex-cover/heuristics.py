@@ -0,0 +1,79 @@
+import heapq
+from typing import Sequence
+
+import igraph as ig
+import numpy as np
+
+# Primal heuristics for vertex cover. They give the branch-and-bound an
+# incumbent before the search starts, so that bound pruning works from the
+# first nodes. Covers are boolean vectors indexed by vertex.
+
+
+def maximal_matching_cover(graph: ig.Graph) -> np.ndarray:
+    "Both endpoints of a greedy maximal matching (a 2-approximation)."
+    cover = np.zeros(graph.vcount(), dtype=bool)
+    for u, v in graph.get_edgelist():
+        if not cover[u] and not cover[v]:
+            cover[u] = cover[v] = True
+    return cover
+
+
+def greedy_max_degree_cover(graph: ig.Graph) -> np.ndarray:
+    "Repeatedly takes a vertex of maximum degree among the uncovered edges."
+    adjacency = [set(neighbours) for neighbours in graph.get_adjlist()]
+    degree = [len(neighbours) for neighbours in adjacency]
+    cover = np.zeros(graph.vcount(), dtype=bool)
+    heap = [(-d, v) for v, d in enumerate(degree) if d > 0]
+    heapq.heapify(heap)
+    while len(heap) > 0:
+        d, v = heapq.heappop(heap)
+        if cover[v] or -d != degree[v]: # stale entry
+            continue
+        if degree[v] == 0:
+            break
+        cover[v] = True
+        for u in adjacency[v]:
+            if not cover[u]:
+                degree[u] -= 1
+                if degree[u] > 0:
+                    heapq.heappush(heap, (-degree[u], u))
+        degree[v] = 0
+    return cover
+
+
+def lp_rounding_cover(values: Sequence[float]) -> np.ndarray:
+    "Every vertex with LP value at least 1/2 (a 2-approximation)."
+    return np.asarray(values) >= 0.5 - 1e-6
+
+
+def remove_redundant(graph: ig.Graph, cover: np.ndarray) -> np.ndarray:
+    """Local search: drops, lowest degree first, every vertex of `cover`
+    whose neighbours are all in the cover, so the result is minimal."""
+    cover = cover.copy()
+    adjacency = graph.get_adjlist()
+    degrees = np.array(graph.degree(), dtype=np.int64)
+    for v in np.flatnonzero(cover)[np.argsort(degrees[cover], kind='stable')]:
+        if all(cover[u] for u in adjacency[v]):
+            cover[v] = False
+    return cover
+
+
+def best_cover(graph: ig.Graph, lp_values: Sequence[float] | None = None
+               ) -> tuple[float, ...]:
+    """Runs every heuristic, each followed by `remove_redundant`, and keeps
+    the smallest cover.
+
+    Args:
+        graph (ig.Graph): An ig.Graph object representing the graph.
+        lp_values (Sequence[float], optional): A solution of the LP
+        relaxation, to be rounded. Defaults to None.
+
+    Returns:
+        tuple[float, ...]: The cover as a binary vector.
+    """
+    candidates = [maximal_matching_cover(graph), greedy_max_degree_cover(graph)]
+    if lp_values is not None and len(lp_values) == graph.vcount():
+        candidates.append(lp_rounding_cover(lp_values))
+    covers = [remove_redundant(graph, cover) for cover in candidates]
+    best = min(covers, key=lambda cover: int(cover.sum()))
+    return tuple(best.astype(float).tolist())
@@ -0,0 +1,179 @@
+from typing import Sequence
+
+import igraph as ig
+import numpy as np
+
+from nemhauser_trotter import half_integral_cover
+
+# Classic vertex cover reductions, applied until none of them changes the
+# graph:
+# - isolated vertex: it is never needed in the cover;
+# - degree 1: some optimal cover takes its neighbour;
+# - degree 2 with adjacent neighbours (triangle): take both neighbours;
+# - degree 2 folding: v with non-adjacent neighbours u, w is replaced, with
+#   u and w, by a new vertex z adjacent to N(u) + N(w). The cover grows by
+#   one: if z is in the kernel cover, u and w are taken, otherwise v is;
+# - dominance: if N[u] is contained in N[v] for an edge uv, take v;
+# - crown: the Nemhauser-Trotter half-integral LP, whose vertices at 1 can
+#   be taken and at 0 left out (it finds every crown of the graph).
+
+
+class Kernel:
+    """A reduced vertex cover instance and what is needed to lift its
+    solutions back to the original graph.
+
+    Attributes:
+        graph (ig.Graph): The kernel, with vertices numbered from 0.
+        vertices (list[int]): The reduction id of each kernel vertex. Ids
+        below `n` are vertices of the original graph, the others are
+        created by folding.
+        cover (set[int]): Ids taken into the cover by the reductions.
+        folds (list[tuple[int, int, int, int]]): The foldings (v, u, w, z)
+        in the order they were made.
+        n (int): The number of vertices of the original graph.
+    """
+    def __init__(self, graph: ig.Graph, vertices: list[int], cover: set[int],
+                 folds: list[tuple[int, int, int, int]], n: int) -> None:
+        self.graph = graph
+        self.vertices = vertices
+        self.cover = cover
+        self.folds = folds
+        self.n = n
+
+    @property
+    def offset(self) -> int:
+        "What the reductions add to the size of any kernel cover."
+        return len(self.cover) + len(self.folds)
+
+    def lift(self, solution: Sequence[float]) -> tuple[float, ...]:
+        """Turns a cover of the kernel into a cover of the original graph.
+
+        Args:
+            solution (Sequence[float]): A binary vector indexed by the kernel
+            vertices.
+
+        Returns:
+            tuple[float, ...]: A binary vector indexed by the original
+            vertices, of size `sum(solution) + offset`.
+        """
+        chosen = set(self.cover)
+        chosen.update(self.vertices[i] for i, value in enumerate(solution)
+                      if value > 0.5)
+        for v, u, w, z in reversed(self.folds):
+            if z in chosen:
+                chosen.discard(z)
+                chosen.update((u, w))
+            else:
+                chosen.add(v)
+        return tuple(1. if v in chosen else 0. for v in range(self.n))
+
+
+def kernelize(graph: ig.Graph, crown: bool = True) -> Kernel:
+    """Applies the reductions to `graph` until a fixpoint.
+
+    Args:
+        graph (ig.Graph): A simple undirected graph.
+        crown (bool, optional): Whether to use the Nemhauser-Trotter LP
+        reduction, the most expensive one. Defaults to True.
+
+    Returns:
+        Kernel: The kernel and the lifting data.
+    """
+    n = graph.vcount()
+    adjacency: dict[int, set[int]] = {v: set() for v in range(n)}
+    for u, v in graph.get_edgelist():
+        if u != v:
+            adjacency[u].add(v)
+            adjacency[v].add(u)
+    cover: set[int] = set()
+    folds: list[tuple[int, int, int, int]] = []
+    next_id = n
+
+    def remove(v: int) -> set[int]:
+        neighbours = adjacency.pop(v)
+        for u in neighbours:
+            adjacency[u].discard(v)
+        return neighbours
+
+    def take(v: int) -> set[int]:
+        cover.add(v)
+        return remove(v)
+
+    def degree_rules(pending: set[int]) -> bool:
+        nonlocal next_id
+        changed = False
+        while len(pending) > 0:
+            v = pending.pop()
+            if v not in adjacency:
+                continue
+            degree = len(adjacency[v])
+            if degree == 0:
+                remove(v)
+            elif degree == 1:
+                u, = adjacency[v]
+                remove(v)
+                pending.update(take(u))
+            elif degree == 2:
+                u, w = adjacency[v]
+                remove(v)
+                if w in adjacency[u]:
+                    pending.update(take(u) | take(w))
+                else:
+                    z = next_id
+                    next_id += 1
+                    adjacency[z] = (remove(u) | remove(w)) - {u, w}
+                    for x in adjacency[z]:
+                        adjacency[x].add(z)
+                    folds.append((v, u, w, z))
+                    pending.update(adjacency[z])
+                    pending.add(z)
+            else:
+                continue
+            changed = True
+        return changed
+
+    def dominance() -> set[int]:
+        touched: set[int] = set()
+        for v in list(adjacency):
+            if v not in adjacency:
+                continue
+            closed_v = adjacency[v] | {v}
+            for u in adjacency[v]:
+                if len(adjacency[u]) <= len(adjacency[v]) and \
+                        adjacency[u] <= closed_v:
+                    touched |= take(v)
+                    break
+        return touched
+
+    def crown_reduction() -> set[int]:
+        ids = list(adjacency)
+        index = {v: i for i, v in enumerate(ids)}
+        edges = np.array([(index[u], index[v]) for u in ids
+                          for v in adjacency[u] if u < v], dtype=np.int64)
+        values = half_integral_cover(len(ids), edges)
+        touched: set[int] = set()
+        for i in np.flatnonzero(values == 1):
+            touched |= take(ids[i])
+        for i in np.flatnonzero(values == 0):
+            if ids[i] in adjacency:
+                touched |= remove(ids[i])
+        return touched
+
+    pending = set(adjacency)
+    while True:
+        degree_rules(pending)
+        pending = dominance()
+        if len(pending) > 0:
+            continue
+        if crown and len(adjacency) > 0:
+            pending = crown_reduction()
+            if len(pending) > 0:
+                continue
+        break
+
+    vertices = sorted(adjacency)
+    index = {v: i for i, v in enumerate(vertices)}
+    kernel = ig.Graph(len(vertices))
+    kernel.add_edges([(index[u], index[v]) for u in vertices
+                      for v in adjacency[u] if u < v])
+    return Kernel(kernel, vertices, cover, folds, n)
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+from typing import Sequence
+
+import igraph as ig
+import numpy as np
+from ortools.linear_solver import linear_solver_pb2, pywraplp
+
+from cuts import Cut
+
+# On-disk cache of what repeated runs on the same graph recompute: the
+# exported solver model, the root relaxation (with the cuts it added) and
+# the optimal cover. Models and root solutions are keyed by the graph
+# fingerprint plus the settings they depend on; covers only by the
+# fingerprint. Every hit touches the file, and the least recently used
+# files are evicted once the directory grows past `max_bytes`.
+
+CACHE_DIR = os.environ.get(
+    'VERTEX_COVER_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'vertex-cover'))
+MAX_CACHE_BYTES = 1 << 28
+
+
+def graph_fingerprint(graph: ig.Graph) -> str:
+    """Hash of the vertex count and the edge set (orientation and order of
+    the edges do not matter)."""
+    n = graph.vcount()
+    edges = np.array(graph.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+    keys = np.unique(np.minimum(edges[:, 0], edges[:, 1]) * max(n, 1)
+                     + np.maximum(edges[:, 0], edges[:, 1]))
+    digest = hashlib.sha256(str(n).encode())
+    digest.update(keys.astype('<i8').tobytes())
+    return digest.hexdigest()
+
+
+class ModelCache:
+    """A cache directory of models, root solutions and optimal covers.
+
+    Args:
+        directory (str, optional): Defaults to CACHE_DIR (the
+        VERTEX_COVER_CACHE environment variable or ~/.cache/vertex-cover).
+        max_bytes (int, optional): Size above which the least recently used
+        files are evicted. Defaults to MAX_CACHE_BYTES.
+    """
+    def __init__(self, directory: str = CACHE_DIR,
+                 max_bytes: int = MAX_CACHE_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, graph: ig.Graph, **settings) -> str:
+        "Key of the graph under the given settings."
+        digest = hashlib.sha256(graph_fingerprint(graph).encode())
+        digest.update(json.dumps(settings, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _read(self, name: str) -> bytes | None:
+        path = self._path(name)
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return data
+
+    def _write(self, name: str, data: bytes):
+        # written to a temporary file first so readers never see a partial one
+        path = self._path(name)
+        temporary = f'{path}.{os.getpid()}.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(data)
+        os.replace(temporary, path)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                status = entry.stat()
+                entries.append((status.st_mtime, status.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def load_model(self, key: str, solver_version: str) -> pywraplp.Solver | None:
+        "A solver loaded with the cached model, or None on a miss."
+        data = self._read(f'{key}.model.pb')
+        if data is None:
+            return None
+        solver = pywraplp.Solver.CreateSolver(solver_version)
+        if not solver:
+            return None
+        error = solver.LoadModelFromProto(linear_solver_pb2.MPModelProto.FromString(data))
+        return solver if error == '' else None
+
+    def store_model(self, key: str, solver: pywraplp.Solver):
+        proto = linear_solver_pb2.MPModelProto()
+        solver.ExportModelToProto(proto)
+        self._write(f'{key}.model.pb', proto.SerializeToString())
+
+    def load_root(self, key: str) -> tuple[float, tuple[float, ...], list[Cut]] | None:
+        """The cached root relaxation (objective, values, cuts), or None on a
+        miss. The cuts are those the root added to the LP, if any."""
+        data = self._read(f'{key}.root.json')
+        if data is None:
+            return None
+        root = json.loads(data)
+        cuts = [(tuple(vertices), rhs) for vertices, rhs in root.get('cuts', [])]
+        return root['objective'], tuple(root['values']), cuts
+
+    def store_root(self, key: str, objective: float, values: tuple[float, ...],
+                   cuts: Sequence[Cut] = ()):
+        self._write(f'{key}.root.json', json.dumps(
+            {'objective': objective, 'values': list(values),
+             'cuts': [[list(vertices), rhs] for vertices, rhs in cuts]}).encode())
+
+    def load_cover(self, graph: ig.Graph) -> tuple[float, ...] | None:
+        "A cached optimal cover of the graph, or None on a miss."
+        data = self._read(f'{graph_fingerprint(graph)}.cover.bin')
+        if data is None:
+            return None
+        return tuple(np.frombuffer(data, dtype=np.uint8).astype(float).tolist())
+
+    def store_cover(self, graph: ig.Graph, cover: tuple[float, ...]):
+        self._write(f'{graph_fingerprint(graph)}.cover.bin',
+                    np.round(cover).astype(np.uint8).tobytes())
@@ -0,0 +1,143 @@
+import numpy as np
+
+# The LP relaxation of vertex cover always has a half-integral optimal
+# solution, and one can be read from a minimum vertex cover of the
+# bipartite double cover of the graph (Nemhauser and Trotter, 1975): every
+# vertex v has a left copy and a right copy, and every edge uv becomes the
+# edges (left u, right v) and (left v, right u). By König's theorem that
+# cover comes from a maximum matching, found here by Hopcroft-Karp in
+# O(m sqrt(n)), with no LP solver involved.
+
+
+def adjacency_lists(n: int, edges: np.ndarray) -> list[list[int]]:
+    """Builds the adjacency lists of an undirected graph from its (m, 2)
+    edge array. Self-loops are ignored."""
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    sources = np.concatenate((edges[:, 0], edges[:, 1]))
+    targets = np.concatenate((edges[:, 1], edges[:, 0]))
+    order = np.argsort(sources, kind='stable')
+    bounds = np.searchsorted(sources[order], np.arange(n + 1))
+    targets = targets[order].tolist()
+    return [targets[bounds[v]:bounds[v + 1]] for v in range(n)]
+
+
+def hopcroft_karp(adjacency: list[list[int]], n_right: int
+                  ) -> tuple[list[int], list[int]]:
+    """Maximum matching of a bipartite graph given by the adjacency lists
+    of its left vertices.
+
+    Returns:
+        tuple[list[int], list[int]]: The right vertex matched to each left
+        vertex and the left vertex matched to each right vertex (-1 if
+        unmatched).
+    """
+    n_left = len(adjacency)
+    match_left = [-1] * n_left
+    match_right = [-1] * n_right
+
+    # greedy initial matching
+    for u in range(n_left):
+        for v in adjacency[u]:
+            if match_right[v] == -1:
+                match_left[u], match_right[v] = v, u
+                break
+
+    while True:
+        # BFS: layers of left vertices from the free ones
+        layer = [-1] * n_left
+        queue = [u for u in range(n_left) if match_left[u] == -1]
+        for u in queue:
+            layer[u] = 0
+        found_free_right = False
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            for v in adjacency[u]:
+                w = match_right[v]
+                if w == -1:
+                    found_free_right = True
+                elif layer[w] == -1:
+                    layer[w] = layer[u] + 1
+                    queue.append(w)
+        if not found_free_right:
+            break
+
+        # DFS along the layers for vertex-disjoint augmenting paths
+        next_edge = [0] * n_left
+        for root in range(n_left):
+            if match_left[root] != -1:
+                continue
+            path = [root]
+            through: list[int] = [] # right vertex used to leave each path vertex
+            while len(path) > 0:
+                u = path[-1]
+                if next_edge[u] == len(adjacency[u]):
+                    layer[u] = -1 # dead end for the rest of this phase
+                    path.pop()
+                    if len(through) > 0:
+                        through.pop()
+                    continue
+                v = adjacency[u][next_edge[u]]
+                next_edge[u] += 1
+                w = match_right[v]
+                if w == -1:
+                    through.append(v)
+                    for left, right in zip(path, through):
+                        match_left[left], match_right[right] = right, left
+                    break
+                if layer[w] == layer[u] + 1:
+                    path.append(w)
+                    through.append(v)
+
+    return match_left, match_right
+
+
+def half_integral_cover(n: int, edges: np.ndarray) -> np.ndarray:
+    """Solves the vertex cover LP of a graph with `n` vertices and the given
+    (m, 2) edge array.
+
+    Returns:
+        np.ndarray: An optimal LP solution with values in {0, 0.5, 1}.
+    """
+    adjacency = adjacency_lists(n, edges)
+    match_left, match_right = hopcroft_karp(adjacency, n)
+
+    # König: Z holds the vertices reachable from the free left vertices by
+    # alternating paths; the minimum cover is (left - Z) + (right & Z)
+    reached_left = [False] * n
+    reached_right = [False] * n
+    queue = [u for u in range(n) if match_left[u] == -1]
+    for u in queue:
+        reached_left[u] = True
+    head = 0
+    while head < len(queue):
+        u = queue[head]
+        head += 1
+        for v in adjacency[u]:
+            if not reached_right[v]:
+                reached_right[v] = True
+                w = match_right[v]
+                if w != -1 and not reached_left[w]:
+                    reached_left[w] = True
+                    queue.append(w)
+
+    left_in_cover = ~np.array(reached_left, dtype=bool)
+    right_in_cover = np.array(reached_right, dtype=bool)
+    return (left_in_cover.astype(float) + right_in_cover.astype(float)) / 2
+
+
+def nemhauser_trotter(n: int, edges: np.ndarray
+                      ) -> tuple[np.ndarray, dict[int, int]]:
+    """Half-integral LP solution and the Nemhauser-Trotter persistency
+    fixings: some minimum vertex cover contains every vertex at 1 and none
+    of the vertices at 0, so only the vertices at 1/2 are left to decide.
+
+    Returns:
+        tuple[np.ndarray, dict[int, int]]: The LP solution and the fixed
+        value of every vertex whose LP value is integral.
+    """
+    values = half_integral_cover(n, edges)
+    fixings = {int(v): int(values[v]) for v in np.flatnonzero(values != 0.5)}
+    return values, fixings
@@ -1,41 +1,70 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+import heapq
+import math
+import multiprocessing as mp
+import time
+from typing import Callable
 
 import igraph as ig
 from matplotlib import pyplot as plt
 import numpy as np
 from ortools.linear_solver import pywraplp
 
-# TODO: 
-# - check feasibility of subproblem and stop gracefully
-# - pararelize the code
-# - introduce stopping conditions: max number of iterations etc.
-#
+from cuts import Cut, separate_cliques, separate_odd_cycles
+from heuristics import best_cover
+from model_cache import ModelCache
+from nemhauser_trotter import half_integral_cover
 
 SOLVER = 'GLOP'
+TOLERANCE = 1e-6
 
-def generate_graph(rng: np.random.Generator, n: int, density: float) -> ig.Graph:
+def _index_to_pair(k: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Maps indices in [0, n(n-1)/2) to the vertex pairs (i, j), j < i, 
+    enumerated row by row: k = i(i-1)/2 + j."""
+    i = ((1 + np.sqrt(1 + 8 * k.astype(np.float64))) // 2).astype(np.int64)
+    # corrects the rounding errors of the square root for large indices
+    i -= (i * (i - 1) // 2 > k)
+    i += ((i + 1) * i // 2 <= k)
+    return i, k - i * (i - 1) // 2
+
+
+def generate_graph(rng: np.random.Generator, 
+                   n: int, 
+                   density: float,
+                   model: str = 'gnm') -> ig.Graph:
     """Generates a random ig.Graph object of given size with a 
     given density of connections.
 
+    The edges are drawn without replacement in a single vectorized call, 
+    as indices of the n(n-1)/2 vertex pairs, so no adjacency matrix is 
+    ever allocated.
+
     Args:
         rng (np.random.Generator): An RNG device (for increased control)
         n (int): The number of vertices.
         density (float): The fraction of connections relative to the complete graph.
+        model (str, optional): 'gnm' draws exactly round(density * n(n-1)/2)
+        edges (the G(n, m) model); 'gnp' keeps each pair with probability
+        `density` (the G(n, p) model). Defaults to 'gnm'.
 
     Returns:
         ig.Graph: The randomly generated graph.
     """    
     if density < 0. or density > 1.:
         raise ValueError('Density must be in [0, 1].')
-    vertices = np.arange(n)
-    adjacency = np.zeros((n, n))
-    max_num_of_edges = n * (n - 1) / 2 
-    for _ in range(round(density * max_num_of_edges)):
-        while True:
-            i, j = rng.choice(vertices, size=2, replace=False)
-            if adjacency[i, j] == 0:
-                adjacency[i, j], adjacency[j, i] = 1, 1
-                break
-    g = ig.Graph.Adjacency(adjacency, mode="undirected")
+    if model not in ('gnm', 'gnp'):
+        raise ValueError("Model must be 'gnm' or 'gnp'.")
+    max_num_of_edges = n * (n - 1) // 2
+    if model == 'gnm':
+        num_of_edges = round(density * max_num_of_edges)
+    else:
+        # G(n, p) is G(n, m) with a binomially distributed m
+        num_of_edges = int(rng.binomial(max_num_of_edges, density))
+    indices = np.sort(rng.choice(max_num_of_edges, size=num_of_edges, replace=False))
+    i, j = _index_to_pair(indices)
+    g = ig.Graph(n=n, edges=np.column_stack((j, i)))
     g.vs['label'] = list(range(n))
     return g
         
@@ -43,24 +72,47 @@ def generate_graph(rng: np.random.Generator, n: int, density: float) -> ig.Graph
 def generate_vertex_cover_problem(
         graph: ig.Graph, 
         fixed_vars: list[tuple[int, int]] | None = None,
-        solver_version: str = SOLVER
+        solver_version: str = SOLVER,
+        named_constraints: bool = True,
+        cache: ModelCache | None = None
         ) -> pywraplp.Solver | None:
     """Creates an instance of a wrapper for a Solver of the given
     algorithm, for example, GLOP, SCIP, GUROBI etc. Populates the
     instance with variables, constraints and objective function 
     definition. All can be retrieved via the `pywraplp` interface.
 
+    The edge constraints are created straight from the graph's edge list,
+    so building the model takes O(n + m) time and memory.
+
     Args:
         graph (ig.Graph): A graph to apply the problem to.
         fixed_vars (list[tuple[int, int]], optional): A list of constraints of 
         type "fixes a variable to a value". Defaults to None.
         solver_version (str, optional): The underlying solver to be used by `pywraplp`. 
         Defaults to SOLVER (global constant).
+        named_constraints (bool, optional): Whether to give each constraint a 
+        descriptive name. Skipping the names saves time and memory on large 
+        graphs. Defaults to True.
+        cache (ModelCache, optional): Without `fixed_vars`, the model is 
+        loaded from this cache when it is there, and stored in it 
+        otherwise. Defaults to None.
 
     Returns:
         pywraplp.Solver | None: The generated solver (problem instance). `None` if
         `Solver` couldn't be instantiated.
     """    
+    if cache is not None and fixed_vars is None:
+        key = cache.key(graph, solver_version=solver_version,
+                        named_constraints=named_constraints)
+        solver = cache.load_model(key, solver_version)
+        if solver is None:
+            solver = generate_vertex_cover_problem(
+                graph, solver_version=solver_version,
+                named_constraints=named_constraints)
+            if solver is not None:
+                cache.store_model(key, solver)
+        return solver
+
     solver: pywraplp.Solver = pywraplp.Solver.CreateSolver(solver_version)
     if not solver:
         return
@@ -68,20 +120,25 @@ def generate_vertex_cover_problem(
     n = len(graph.vs)
     x = [ solver.IntVar(0, 1, f'x_{i}') for i in range(n)]
 
-    solver.Minimize(sum(x))
+    objective = solver.Objective()
+    for var in x:
+        objective.SetCoefficient(var, 1)
+    objective.SetMinimization()
 
-    adjacency = graph.get_adjacency()
-    for i in range(1, n):
-        for j in range(0, i):
-            if adjacency[i][j] == 1:
-                if i < j: 
-                    continue
-                solver.Add(x[i] + x[j] >= 1,
-                           f'x_{i} + x_{j} >= 1')
+    infinity = solver.infinity()
+    for i, j in graph.get_edgelist():
+        if i < j:
+            i, j = j, i
+        name = f'x_{i} + x_{j} >= 1' if named_constraints else ''
+        constraint = solver.Constraint(1, infinity, name)
+        constraint.SetCoefficient(x[i], 1)
+        constraint.SetCoefficient(x[j], 1)
     
     if fixed_vars is not None:
         for index, value in fixed_vars:
-            solver.Add(x[index] == value, f'x_{index} == {value}')
+            name = f'x_{index} == {value}' if named_constraints else ''
+            constraint = solver.Constraint(value, value, name)
+            constraint.SetCoefficient(x[index], 1)
     
     return solver
 
@@ -96,11 +153,778 @@ def get_objective_value(vars: list[pywraplp.Variable]) -> float:
     return sum(var.solution_value() for var in vars)    
 
 
-def solve_bab_vertex_cover(graph: ig.Graph) -> tuple[tuple[float, ...], ig.Graph]:
+class WarmStartedLP:
+    """A single vertex cover LP reused by every node of the branch-and-bound.
+
+    Branching decisions are applied as variable bounds instead of new 
+    constraints. Moving to another node only changes the bounds that differ 
+    from the previous node (undoing the fixings that are no longer on the 
+    path), so the model is built once and the solver can restart from the 
+    previous basis.
+    """
+    def __init__(self, graph: ig.Graph, solver_version: str = SOLVER,
+                 cache: ModelCache | None = None) -> None:
+        self.solver = generate_vertex_cover_problem(
+            graph, solver_version=solver_version, cache=cache)
+        self.vars: list[pywraplp.Variable] = \
+            self.solver.variables() if self.solver is not None else []
+        self.fixed: dict[int, int] = {}
+
+    def apply(self, fixed_vars: list[tuple[int, int]]):
+        "Sets the variable bounds to the given fixings, undoing the others."
+        target = dict(fixed_vars)
+        for index, value in self.fixed.items():
+            if target.get(index) != value:
+                self.vars[index].SetBounds(0, 1)
+        for index, value in target.items():
+            if self.fixed.get(index) != value:
+                self.vars[index].SetBounds(value, value)
+        self.fixed = target
+
+    def solve(self, fixed_vars: list[tuple[int, int]]
+              ) -> tuple[int, float, tuple[float, ...]]:
+        """Solves the LP of the node given by `fixed_vars`.
+
+        Returns:
+            tuple[int, float, tuple[float, ...]]: The solver status, the 
+            objective value and the value of each variable.
+        """
+        assert self.solver is not None
+        self.apply(fixed_vars)
+        status = self.solver.Solve()
+        values = tuple(var.solution_value() for var in self.vars)
+        return status, sum(values), values
+
+
+CUT_MODES = ('none', 'root', 'nodes')
+ROOT_CUT_ROUNDS = 20
+NODE_CUT_ROUNDS = 2
+# Node cuts kept in the model at once; beyond that the oldest is replaced
+MAX_NODE_CUTS = 200
+
+
+class CuttingPlaneLP(WarmStartedLP):
+    """A `WarmStartedLP` strengthened by clique and odd-cycle cuts (see 
+    `cuts`). After solving a node, violated cuts are separated and added 
+    and the LP is solved again, for up to `root_rounds` rounds at the root 
+    and `node_rounds` at the other nodes. A cut already in the model (the 
+    same vertex set) is never added twice.
+
+    The cuts are valid for the whole tree. Those found at the root, or 
+    given in `cuts`, stay in the model and are listed in `cuts`. Those 
+    found at the other nodes are aged out: at most `max_node_cuts` are kept, 
+    and the row of the oldest one is reused for a new cut, so the LP does 
+    not keep growing during the search.
+    """
+    def __init__(self, graph: ig.Graph, solver_version: str = SOLVER,
+                 cache: ModelCache | None = None,
+                 root_rounds: int = ROOT_CUT_ROUNDS,
+                 node_rounds: int = 0,
+                 cuts: list[Cut] | None = None,
+                 max_node_cuts: int = MAX_NODE_CUTS) -> None:
+        super().__init__(graph, solver_version, cache)
+        self.adjacency = [set(neighbours) for neighbours in graph.get_adjlist()]
+        self.root_rounds = root_rounds
+        self.node_rounds = node_rounds
+        self.max_node_cuts = max_node_cuts
+        self.cuts: list[Cut] = []
+        # vertex sets of every cut in the model, and the node cuts, oldest 
+        # first, with their rows
+        self.keys: set[frozenset[int]] = set()
+        self.node_cuts: deque[tuple[frozenset[int], pywraplp.Constraint]] = deque()
+        if self.solver is not None and cuts is not None:
+            self.add_cuts(cuts)
+
+    def add_cuts(self, cuts: list[Cut], permanent: bool = True) -> int:
+        """Adds the cuts not yet in the model, as permanent cuts or as node 
+        cuts (see the class docstring).
+
+        Returns:
+            int: The number of cuts added.
+        """
+        assert self.solver is not None
+        infinity = self.solver.infinity()
+        added = 0
+        for vertices, rhs in cuts:
+            key = frozenset(vertices)
+            if key in self.keys:
+                continue
+            if not permanent and len(self.node_cuts) >= self.max_node_cuts:
+                old_key, constraint = self.node_cuts.popleft()
+                self.keys.discard(old_key)
+                constraint.Clear()
+                constraint.SetBounds(rhs, infinity)
+            else:
+                constraint = self.solver.Constraint(rhs, infinity)
+            for v in vertices:
+                constraint.SetCoefficient(self.vars[v], 1)
+            self.keys.add(key)
+            if permanent:
+                self.cuts.append((vertices, rhs))
+            else:
+                self.node_cuts.append((key, constraint))
+            added += 1
+        return added
+
+    def solve(self, fixed_vars: list[tuple[int, int]]
+              ) -> tuple[int, float, tuple[float, ...]]:
+        status, objective, values = super().solve(fixed_vars)
+        at_root = len(fixed_vars) == 0
+        rounds = self.root_rounds if at_root else self.node_rounds
+        for _ in range(rounds):
+            if status != pywraplp.Solver.OPTIMAL:
+                break
+            cuts = separate_cliques(self.adjacency, values) + \
+                separate_odd_cycles(self.adjacency, values)
+            if self.add_cuts(cuts, permanent=at_root) == 0:
+                break
+            status, objective, values = super().solve(fixed_vars)
+        return status, objective, values
+
+
+class HalfIntegralRelaxation:
+    """The vertex cover LP solved combinatorially, through a maximum matching 
+    in the bipartite double cover of the graph (see `nemhauser_trotter`).
+
+    It has the same interface as `WarmStartedLP` and gives the same bounds, 
+    with half-integral values. At a node, the vertices fixed to 1 are 
+    removed, the free neighbours of the vertices fixed to 0 are forced to 
+    1, and the LP is solved on the graph induced by the remaining free 
+    vertices.
+    """
+    def __init__(self, graph: ig.Graph, cache: ModelCache | None = None) -> None:
+        self.n = graph.vcount()
+        self.edges = np.array(graph.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+
+    def solve(self, fixed_vars: list[tuple[int, int]]
+              ) -> tuple[int, float, tuple[float, ...]]:
+        """Solves the LP of the node given by `fixed_vars`.
+
+        Returns:
+            tuple[int, float, tuple[float, ...]]: The solver status, the 
+            objective value and the value of each variable.
+        """
+        values = np.full(self.n, -1.)
+        for index, value in fixed_vars:
+            values[index] = value
+        u, v = self.edges[:, 0], self.edges[:, 1]
+        zero = values == 0
+        if np.any(zero[u] & zero[v]):
+            return pywraplp.Solver.INFEASIBLE, 0., ()
+
+        forced = np.zeros(self.n, dtype=bool)
+        forced[v[zero[u]]] = True
+        forced[u[zero[v]]] = True
+        values[forced & (values == -1)] = 1.
+
+        free = values == -1
+        sub_edges = self.edges[free[u] & free[v]]
+        values[free] = half_integral_cover(self.n, sub_edges)[free]
+        return pywraplp.Solver.OPTIMAL, float(values.sum()), tuple(values.tolist())
+
+
+RELAXATIONS = {
+    'lp': WarmStartedLP,
+    'nemhauser-trotter': HalfIntegralRelaxation,
+}
+
+
+class BranchAndBoundStats:
+    """Counters collected during a branch-and-bound run.
+
+    `nodes_processed` counts the nodes whose relaxation was solved; nodes
+    pruned by their parent's bound are not. Times are in seconds and split
+    the run between solving relaxations, choosing the branching variable
+    and bookkeeping (open list and search tree). 
+    `lower_bound` is the proven lower bound on the cover size when the run 
+    ended; it equals the size of the cover found unless a limit stopped it.
+    """
+    def __init__(self) -> None:
+        self.nodes_processed = 0
+        self.pruned_by_bound = 0
+        self.pruned_infeasible = 0
+        self.integral_leaves = 0
+        self.max_open = 0
+        self.relaxation_time = 0.
+        self.branching_time = 0.
+        self.bookkeeping_time = 0.
+        self.lower_bound = 0.
+
+    def merge(self, other: 'BranchAndBoundStats'):
+        "Adds the counters of another run (e.g. a parallel task) to these."
+        for name, value in vars(other).items():
+            if name == 'max_open':
+                self.max_open = max(self.max_open, value)
+            elif name != 'lower_bound':
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> dict[str, float]:
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        return '\n'.join(f'{name}: {value}' for name, value in vars(self).items())
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+BRANCHING_RULES = ('first', 'most-fractional', 'max-degree', 'pseudo-cost', 'strong')
+
+
+class BranchingRule:
+    """Chooses the fractional variable to branch on.
+
+    - 'first': the first one in index order;
+    - 'most-fractional': the value closest to 1/2;
+    - 'max-degree': the vertex of largest degree;
+    - 'strong': solves both children of up to `max_candidates` variables 
+      (the ones of largest degree) on the warm LP and takes the best 
+      product of the two bound gains;
+    - 'pseudo-cost': the best product of the average gains observed when 
+      branching on each variable. A variable is reliable once each 
+      direction was observed `reliability` times; until then, it is 
+      evaluated by strong branching, which also feeds its pseudo-costs.
+
+    Vertex solutions of the vertex cover LP are half-integral, so the 
+    gains are not divided by the distance to the rounded value.
+    """
+    def __init__(self, rule: str = 'first',
+                 engine: 'WarmStartedLP | HalfIntegralRelaxation | None' = None,
+                 degrees: list[int] | None = None,
+                 reliability: int = 4,
+                 max_candidates: int = 8) -> None:
+        if rule not in BRANCHING_RULES:
+            raise ValueError(f'Branching must be one of {BRANCHING_RULES}.')
+        self.rule = rule
+        self.engine = engine
+        self.degrees = degrees
+        self.reliability = reliability
+        self.max_candidates = max_candidates
+        # per variable and direction (0 or 1): sum of gains and count
+        self.gains: dict[tuple[int, int], float] = {}
+        self.counts: dict[tuple[int, int], int] = {}
+        # fixings of the children solved by `strong` at the last call, per 
+        # candidate, and of the created children it already observed
+        self.solved: dict[int, list[tuple[tuple[int, int], ...]]] = {}
+        self.probed: set[tuple[tuple[int, int], ...]] = set()
+
+    def observe(self, branch: tuple[int, int], parent_bound: float, objective: float):
+        "Records the bound gain of a child created by fixing `branch`."
+        self.gains[branch] = self.gains.get(branch, 0.) + max(objective - parent_bound, 0.)
+        self.counts[branch] = self.counts.get(branch, 0) + 1
+
+    def observe_node(self, fixed_vars: list[tuple[int, int]], parent_bound: float,
+                     objective: float):
+        """Records the gain of a node solved by the search, unless strong 
+        branching already observed it when choosing its parent's variable."""
+        key = tuple(fixed_vars)
+        if key in self.probed:
+            self.probed.discard(key)
+        else:
+            self.observe(fixed_vars[-1], parent_bound, objective)
+
+    def forget(self, fixed_vars: list[tuple[int, int]]):
+        "Drops a node that is pruned without being solved."
+        self.probed.discard(tuple(fixed_vars))
+
+    def pseudo_cost(self, index: int, value: int) -> float:
+        count = self.counts.get((index, value), 0)
+        if count == 0: # the average over all variables
+            total = sum(gain for (_, v), gain in self.gains.items() if v == value)
+            observed = sum(c for (_, v), c in self.counts.items() if v == value)
+            return total / observed if observed > 0 else 1.
+        return self.gains[(index, value)] / count
+
+    def score(self, index: int) -> float:
+        return max(self.pseudo_cost(index, 0), TOLERANCE) * \
+            max(self.pseudo_cost(index, 1), TOLERANCE)
+
+    def strong(self, fixed_vars: list[tuple[int, int]], objective: float,
+               candidates: list[int]) -> int:
+        """Solves both children of each candidate and returns the one with 
+        the best product of gains (an infeasible child counts as a huge 
+        gain)."""
+        assert self.engine is not None and self.degrees is not None
+        degrees = self.degrees
+        candidates = sorted(candidates, key=lambda i: -degrees[i])[:self.max_candidates]
+        best, best_score = candidates[0], -1.
+        for index in candidates:
+            score = 1.
+            for value in (0, 1):
+                child_vars = fixed_vars + [(index, value)]
+                status, child, _ = self.engine.solve(child_vars)
+                if status == pywraplp.Solver.OPTIMAL:
+                    self.observe((index, value), objective, child)
+                    self.solved.setdefault(index, []).append(tuple(child_vars))
+                    score *= max(child - objective, TOLERANCE)
+                else:
+                    score *= 1 / TOLERANCE
+            if score > best_score:
+                best, best_score = index, score
+        return best
+
+    def select(self, fixed_vars: list[tuple[int, int]], values: tuple[float, ...],
+               objective: float) -> int | None:
+        """The variable to branch on at the node given by `fixed_vars`, 
+        with LP solution `values` and bound `objective`, or None if the 
+        solution is integral."""
+        fractional = [i for i, value in enumerate(values)
+                      if TOLERANCE < value < 1 - TOLERANCE]
+        if len(fractional) == 0:
+            return None
+        if self.rule == 'first':
+            return fractional[0]
+        if self.rule == 'most-fractional':
+            return min(fractional, key=lambda i: abs(values[i] - 0.5))
+        assert self.degrees is not None
+        degrees = self.degrees
+        if self.rule == 'max-degree':
+            return max(fractional, key=lambda i: degrees[i])
+        self.solved.clear()
+        if self.rule == 'strong':
+            index = self.strong(fixed_vars, objective, fractional)
+        else:
+            unreliable = [i for i in fractional
+                          if min(self.counts.get((i, 0), 0),
+                                 self.counts.get((i, 1), 0)) < self.reliability]
+            if len(unreliable) > 0:
+                self.strong(fixed_vars, objective, unreliable)
+            index = max(fractional, key=self.score)
+        # the children of `index` are about to be created: their gains are 
+        # already recorded
+        self.probed.update(self.solved.get(index, ()))
+        return index
+
+
+SEARCH_ORDERS = ('dfs', 'best-bound')
+
+# An open node: (parent's bound, tree vertex, fixed vars)
+OpenNode = tuple[float, int, list[tuple[int, int]]]
+# Called with each improving cover and the lower bound at that moment
+IncumbentCallback = Callable[[tuple[float, ...], float], None]
+
+
+class SearchTree:
+    """The branch-and-bound tree, kept as lists of parents and labels and 
+    turned into an ig.Graph at the end.
+
+    Workers of the parallel mode grow their own fragment, whose vertex 0 
+    is the node they were given, and the fragments are grafted onto the 
+    main tree with `merge`.
+    """
+    def __init__(self, root_label: str = 'root') -> None:
+        self.parents: list[int] = [-1]
+        self.labels: list[str] = [root_label]
+
+    def add(self, parent: int, label: str) -> int:
+        self.parents.append(parent)
+        self.labels.append(label)
+        return len(self.parents) - 1
+
+    def annotate(self, vertex: int, text: str):
+        self.labels[vertex] += text
+
+    def merge(self, fragment: 'SearchTree', vertex: int) -> list[int]:
+        """Grafts `fragment` onto `vertex`, which stands for its vertex 0.
+
+        Returns:
+            list[int]: The vertex of this tree for each vertex of `fragment`.
+        """
+        self.annotate(vertex, fragment.labels[0])
+        mapping = [vertex]
+        for parent, label in zip(fragment.parents[1:], fragment.labels[1:]):
+            mapping.append(self.add(mapping[parent], label))
+        return mapping
+
+    def to_igraph(self) -> ig.Graph:
+        tree = ig.Graph(len(self.parents),
+                        [(parent, child) for child, parent in enumerate(self.parents)
+                         if parent >= 0])
+        tree.vs['name'] = ['root'] + [str(v) for v in range(1, len(self.parents))]
+        tree.vs['label'] = self.labels
+        return tree
+
+
+def _explore(engine: WarmStartedLP | HalfIntegralRelaxation,
+             roots: list[OpenNode],
+             tree: SearchTree,
+             stats: BranchAndBoundStats,
+             search: str,
+             optimum: float,
+             best_solution: tuple[float, ...] = (),
+             shared=None,
+             node_limit: int | None = None,
+             max_depth: int | None = None,
+             deadline: float | None = None,
+             gap_limit: float | None = None,
+             incumbent_callback: IncumbentCallback | None = None,
+             progress_callback: Callable[[BranchAndBoundStats], None] | None = None,
+             progress_interval: int = 1000,
+             branching: BranchingRule | None = None,
+             root: tuple[float, tuple[float, ...]] | None = None
+             ) -> tuple[float, tuple[float, ...], list[OpenNode]]:
+    """Explores the subtrees rooted at `roots` until the open list is empty,
+    `node_limit` nodes were processed, the `time.perf_counter()` 
+    `deadline` passed or the relative gap fell to `gap_limit`. Nodes at 
+    depth `max_depth` are left unsolved. `incumbent_callback` gets every 
+    improving cover with the lower bound at that moment, which is also 
+    left in `stats.lower_bound` at the end. `branching` defaults to the 
+    'first' rule. `root`, the (objective, values) of the relaxation with no 
+    fixed variables, saves solving it again when it was already solved.
+
+    `shared` is an optional `multiprocessing.Value` holding the best cover 
+    size known by every process; it prunes as the local `optimum` does and 
+    is lowered whenever a better cover is found here.
+
+    Returns:
+        tuple[float, tuple[float, ...], list[OpenNode]]: The best cover size 
+        found (or the given `optimum` and `best_solution`), its solution 
+        and the nodes left open.
+    """
+    # open list entries: (parent's bound, insertion counter, tree vertex, fixed vars)
+    open_nodes: list[tuple[float, int, int, list[tuple[int, int]]]] = []
+    counter = 0
+    remaining: list[OpenNode] = []
+    processed = 0
+    # the gap is checked at the top of the loop, while every open node still
+    # counts for the lower bound, and only when it may have changed
+    check_gap = False
+
+    def push(bound: float, tree_vertex: int, fixed_vars: list[tuple[int, int]]):
+        nonlocal counter
+        if search == 'best-bound':
+            heapq.heappush(open_nodes, (bound, counter, tree_vertex, fixed_vars))
+        else:
+            open_nodes.append((bound, counter, tree_vertex, fixed_vars))
+        counter += 1
+
+    def pop() -> tuple[float, int, int, list[tuple[int, int]]]:
+        if search == 'best-bound':
+            return heapq.heappop(open_nodes)
+        return open_nodes.pop()
+
+    def cannot_improve(bound: float) -> bool:
+        limit = optimum if shared is None else min(optimum, shared.value)
+        return math.ceil(bound - TOLERANCE) >= limit
+
+    def lower_bound() -> float:
+        bounds = [entry[0] for entry in open_nodes] + [node[0] for node in remaining]
+        return min([optimum] + [math.ceil(bound - TOLERANCE) for bound in bounds])
+
+    def gap_closed() -> bool:
+        return gap_limit is not None and \
+            optimum - lower_bound() <= gap_limit * optimum
+
+    if branching is None:
+        branching = BranchingRule()
+    for bound, tree_vertex, fixed_vars in reversed(roots):
+        push(bound, tree_vertex, fixed_vars)
+
+    while len(open_nodes) > 0:
+        if node_limit is not None and processed >= node_limit:
+            break
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        if check_gap and gap_closed():
+            break
+        check_gap = False
+        stats.max_open = max(stats.max_open, len(open_nodes))
+        bookkeeping_start = time.perf_counter()
+        parent_bound, _, tree_vertex, fixed_vars = pop()
+        relaxation_start = time.perf_counter()
+        stats.bookkeeping_time += relaxation_start - bookkeeping_start
+        if cannot_improve(parent_bound):
+            stats.pruned_by_bound += 1
+            branching.forget(fixed_vars)
+            continue
+        if max_depth is not None and len(fixed_vars) >= max_depth:
+            remaining.append((parent_bound, tree_vertex, fixed_vars))
+            continue
+
+        if len(fixed_vars) == 0 and root is not None:
+            status, (objective, values) = pywraplp.Solver.OPTIMAL, root
+        else:
+            status, objective, values = engine.solve(fixed_vars)
+        branching_start = time.perf_counter()
+        stats.relaxation_time += branching_start - relaxation_start
+        stats.nodes_processed += 1
+        processed += 1
+        if stats.nodes_processed % progress_interval == 0:
+            if progress_callback is not None:
+                progress_callback(stats)
+            check_gap = True
+
+        if status not in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
+            stats.pruned_infeasible += 1
+            continue
+        if len(fixed_vars) > 0:
+            tree.annotate(tree_vertex, f'\n{objective}')
+            branching.observe_node(fixed_vars, parent_bound, objective)
+        if cannot_improve(objective):
+            stats.pruned_by_bound += 1
+            continue
+        
+        branching_index = branching.select(fixed_vars, values, objective)
+        
+        if branching_index is None:
+            stats.integral_leaves += 1
+            optimum = round(objective)
+            best_solution = tuple(float(round(value)) for value in values)
+            if shared is not None:
+                with shared.get_lock():
+                    if optimum < shared.value:
+                        shared.value = optimum
+            stats.branching_time += time.perf_counter() - branching_start
+            if incumbent_callback is not None:
+                incumbent_callback(best_solution, lower_bound())
+            check_gap = True
+            continue
+        
+        fixed_vars_ceil = fixed_vars + [(branching_index, 1)]
+        fixed_vars_floor = fixed_vars + [(branching_index, 0)]
+        bookkeeping_start = time.perf_counter()
+        stats.branching_time += bookkeeping_start - branching_start
+
+        for label, fixed in ((f'x{branching_index}=1', fixed_vars_ceil),
+                             (f'x{branching_index}=0', fixed_vars_floor)):
+            push(objective, tree.add(tree_vertex, label), fixed)
+        stats.bookkeeping_time += time.perf_counter() - bookkeeping_start
+
+    for parent_bound, _, tree_vertex, fixed_vars in open_nodes:
+        remaining.append((parent_bound, tree_vertex, fixed_vars))
+    open_nodes.clear()
+    stats.lower_bound = lower_bound()
+    return optimum, best_solution, remaining
+
+
+# State of each worker process of the parallel mode, set once by 
+# `_init_worker`: pywraplp models cannot be sent between processes, so 
+# every worker builds its own.
+_worker_engine: WarmStartedLP | HalfIntegralRelaxation | None = None
+_worker_search = 'dfs'
+_worker_best = None
+_worker_branching: BranchingRule | None = None
+
+
+def _init_worker(graph: ig.Graph, relaxation: str, search: str, best,
+                 cuts: list[Cut] | None, node_rounds: int, branching: str):
+    global _worker_engine, _worker_search, _worker_best, _worker_branching
+    if cuts is not None: # the root cuts found by the main process
+        _worker_engine = CuttingPlaneLP(graph, root_rounds=0,
+                                        node_rounds=node_rounds, cuts=cuts)
+    else:
+        _worker_engine = RELAXATIONS[relaxation](graph)
+    _worker_search = search
+    _worker_best = best
+    _worker_branching = BranchingRule(branching, _worker_engine, graph.degree())
+
+
+def _explore_task(node: OpenNode, node_limit: int, wall_deadline: float | None
+                  ) -> tuple[float, tuple[float, ...], list[OpenNode],
+                             SearchTree, BranchAndBoundStats]:
+    assert _worker_engine is not None and _worker_best is not None
+    fragment = SearchTree(root_label='')
+    stats = BranchAndBoundStats()
+    bound, _, fixed_vars = node
+    # the deadline comes in `time.time()`, the clock shared by the processes
+    deadline = None if wall_deadline is None \
+        else time.perf_counter() + (wall_deadline - time.time())
+    optimum, solution, remaining = _explore(
+        _worker_engine, [(bound, 0, fixed_vars)], fragment, stats,
+        _worker_search, _worker_best.value, shared=_worker_best,
+        node_limit=node_limit, deadline=deadline, branching=_worker_branching)
+    return optimum, solution, remaining, fragment, stats
+
+
+def _explore_parallel(graph: ig.Graph,
+                      engine: WarmStartedLP | HalfIntegralRelaxation,
+                      tree: SearchTree,
+                      stats: BranchAndBoundStats,
+                      search: str,
+                      relaxation: str,
+                      processes: int,
+                      split_depth: int,
+                      task_node_limit: int,
+                      progress_callback: Callable[[BranchAndBoundStats], None] | None,
+                      progress_interval: int,
+                      optimum: float,
+                      best_solution: tuple[float, ...],
+                      root_bound: float,
+                      node_limit: int | None,
+                      deadline: float | None,
+                      gap_limit: float | None,
+                      incumbent_callback: IncumbentCallback | None,
+                      branching: BranchingRule,
+                      root: tuple[float, tuple[float, ...]] | None
+                      ) -> tuple[float, tuple[float, ...], bool]:
+    """The parallel mode of `solve_bab_vertex_cover`.
+
+    Returns:
+        tuple[float, tuple[float, ...], bool]: The best cover size, its 
+        solution and whether the whole tree was explored.
+    """
+    best = mp.Value('d', float(optimum))
+    # The top of the tree is explored here; the nodes at `split_depth` are 
+    # the first tasks
+    optimum, best_solution, open_nodes = _explore(
+        engine, [(root_bound, 0, [])], tree, stats, search, optimum, 
+        best_solution, best, node_limit=node_limit, max_depth=split_depth,
+        deadline=deadline, gap_limit=gap_limit,
+        incumbent_callback=incumbent_callback, progress_callback=progress_callback,
+        progress_interval=progress_interval, branching=branching, root=root)
+    # nodes waiting for a task, tasks being explored with the node budget 
+    # reserved for each (which keeps the node limit exact), and bounds of 
+    # the subtrees left unexplored by a limit
+    waiting: deque[OpenNode] = deque(open_nodes)
+    pending: dict = {}
+    unexplored: list[float] = []
+
+    def lower_bound() -> float:
+        bounds = [node[0] for node, _ in pending.values()] + \
+            [node[0] for node in waiting] + unexplored
+        return min([optimum] + [math.ceil(bound - TOLERANCE) for bound in bounds])
+
+    def limit_reached() -> bool:
+        return (node_limit is not None and stats.nodes_processed >= node_limit) \
+            or (deadline is not None and time.perf_counter() >= deadline) \
+            or (gap_limit is not None and optimum - lower_bound() <= gap_limit * optimum)
+
+    if isinstance(engine, CuttingPlaneLP):
+        cuts, node_rounds = engine.cuts, engine.node_rounds
+    else:
+        cuts, node_rounds = None, 0
+    # the deadline travels in `time.time()`, the only clock shared by the 
+    # processes, so that tasks queued in the pool do not outlive it
+    wall_deadline = None if deadline is None \
+        else time.time() + (deadline - time.perf_counter())
+    with ProcessPoolExecutor(processes, initializer=_init_worker,
+                             initargs=(graph, relaxation, search, best, cuts,
+                                       node_rounds, branching.rule)) as executor:
+
+        def schedule():
+            while len(waiting) > 0:
+                limit = task_node_limit
+                if node_limit is not None:
+                    reserved = sum(budget for _, budget in pending.values())
+                    limit = min(limit, node_limit - stats.nodes_processed - reserved)
+                if limit <= 0 or (deadline is not None and time.perf_counter() >= deadline):
+                    return
+                node = waiting.popleft()
+                task = executor.submit(_explore_task, node, limit, wall_deadline)
+                pending[task] = (node, limit)
+
+        stopping = limit_reached()
+        if not stopping:
+            schedule()
+        while len(pending) > 0:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for task in done:
+                (bound, tree_vertex, _), _ = pending.pop(task)
+                if task.cancelled():
+                    unexplored.append(bound)
+                    continue
+                task_optimum, solution, remaining, fragment, task_stats = task.result()
+                stats.merge(task_stats)
+                # Large subtrees come back with their open nodes, which 
+                # wait to become new tasks
+                mapping = tree.merge(fragment, tree_vertex)
+                for bound, vertex, fixed_vars in remaining:
+                    waiting.append((bound, mapping[vertex], fixed_vars))
+                if len(solution) > 0 and task_optimum < optimum:
+                    optimum, best_solution = task_optimum, solution
+                    if incumbent_callback is not None:
+                        incumbent_callback(best_solution, lower_bound())
+                if progress_callback is not None:
+                    progress_callback(stats)
+            if not stopping and limit_reached():
+                stopping = True
+                for task in pending:
+                    task.cancel()
+            if not stopping:
+                schedule()
+    unexplored.extend(node[0] for node in waiting)
+    waiting.clear()
+
+    stats.lower_bound = lower_bound()
+    return optimum, best_solution, len(unexplored) == 0
+
+
+def solve_bab_vertex_cover(
+        graph: ig.Graph,
+        stats: BranchAndBoundStats | None = None,
+        progress_callback: Callable[[BranchAndBoundStats], None] | None = None,
+        progress_interval: int = 1000,
+        search: str = 'dfs',
+        relaxation: str = 'lp',
+        processes: int | None = None,
+        split_depth: int = 6,
+        task_node_limit: int = 1000,
+        heuristics: bool = True,
+        time_limit: float | None = None,
+        node_limit: int | None = None,
+        gap_limit: float | None = None,
+        incumbent_callback: IncumbentCallback | None = None,
+        cache: ModelCache | None = None,
+        cuts: str = 'none',
+        branching: str = 'first'
+        ) -> tuple[tuple[float, ...], ig.Graph]:
     """Given a simple undirected graph, estimates its optimal vertex cover.
 
+    Children are put in the open list unsolved, with their parent's LP 
+    bound, and their LP is solved only when they are taken out of it. A 
+    node is pruned, before or after solving its LP, when its bound rounded 
+    up cannot improve on the best cover found so far. With `heuristics`, 
+    the search starts from the best cover given by `heuristics.best_cover` 
+    (matching, greedy and root LP rounding, followed by local search).
+
     Args:
         graph (ig.Graph): An ig.Graph object representing the graph.
+        stats (BranchAndBoundStats, optional): If given, it is filled with 
+        the counters of the run. Defaults to None.
+        progress_callback (Callable[[BranchAndBoundStats], None], optional): 
+        Called with the counters every `progress_interval` processed nodes. 
+        In the parallel mode, this holds while the main process explores 
+        the top of the tree; after that, it is called whenever a task 
+        finishes. Defaults to None.
+        progress_interval (int, optional): Defaults to 1000.
+        search (str, optional): The order in which open nodes are explored: 
+        'dfs' (a stack) or 'best-bound' (a heap on the parent's LP bound). 
+        Defaults to 'dfs'.
+        relaxation (str, optional): The bound engine: 'lp' (a warm-started 
+        LP solver) or 'nemhauser-trotter' (the half-integral LP through 
+        bipartite matching, no LP solver). Defaults to 'lp'.
+        processes (int, optional): With more than one process, the nodes at 
+        depth `split_depth` are explored by a pool of worker processes, 
+        each holding its own model and sharing the best cover size. A task 
+        stops after `task_node_limit` nodes and its open nodes become new 
+        tasks. Defaults to None (serial).
+        split_depth (int, optional): Defaults to 6.
+        task_node_limit (int, optional): Defaults to 1000.
+        heuristics (bool, optional): Defaults to True.
+        time_limit (float, optional): Wall-clock limit in seconds. Defaults 
+        to None.
+        node_limit (int, optional): Limit on processed nodes. In the 
+        parallel mode, each task is given part of the nodes left and no 
+        task is started once they are all handed out, so the limit is 
+        exact too. Defaults to None.
+        gap_limit (float, optional): Stops once (best - lower bound) / best 
+        is at most this. Defaults to None.
+        incumbent_callback (IncumbentCallback, optional): Called with every 
+        improving cover (including the heuristic one) and the lower bound 
+        at that moment. When a limit stops the search, the best cover so 
+        far is returned and `stats.lower_bound` holds the final bound. 
+        Defaults to None.
+        cache (ModelCache, optional): Where to find the LP model, the root 
+        relaxation and a proven optimal cover of `graph` from earlier runs. 
+        A cached optimal cover is returned at once, with a tree holding 
+        only the root; a cover is stored only when no limit stopped the 
+        search. Defaults to None.
+        cuts (str, optional): Clique and odd-cycle cuts for the 'lp' 
+        relaxation (see `CuttingPlaneLP`): 'none', 'root' (up to 
+        ROOT_CUT_ROUNDS rounds at the root) or 'nodes' (also up to 
+        NODE_CUT_ROUNDS rounds at every node). Defaults to 'none'.
+        branching (str, optional): How to choose the branching variable, 
+        one of BRANCHING_RULES (see `BranchingRule`). Defaults to 'first'.
 
     Returns:
         tuple[tuple[float, ...], ig.Graph]: The solution in the form of a binary vector
@@ -108,77 +932,181 @@ def solve_bab_vertex_cover(graph: ig.Graph) -> tuple[tuple[float, ...], ig.Graph
         `graph` and the tree (ig.Graph object) showing all the 
         decisions of the branch-and-bound.
     """    
-    solver = generate_vertex_cover_problem(graph)
-    if solver is None: 
+    if search not in SEARCH_ORDERS:
+        raise ValueError(f'Search must be one of {SEARCH_ORDERS}.')
+    if relaxation not in RELAXATIONS:
+        raise ValueError(f'Relaxation must be one of {tuple(RELAXATIONS)}.')
+    if cuts not in CUT_MODES:
+        raise ValueError(f'Cuts must be one of {CUT_MODES}.')
+    if cuts != 'none' and relaxation != 'lp':
+        raise ValueError("Cuts need the 'lp' relaxation.")
+    if branching not in BRANCHING_RULES:
+        raise ValueError(f'Branching must be one of {BRANCHING_RULES}.')
+    if stats is None:
+        stats = BranchAndBoundStats()
+
+    start = time.perf_counter()
+    deadline = None if time_limit is None else start + time_limit
+    if cache is not None:
+        cover = cache.load_cover(graph)
+        if cover is not None and len(cover) == graph.vcount():
+            stats.lower_bound = sum(cover)
+            if incumbent_callback is not None:
+                incumbent_callback(cover, stats.lower_bound)
+            return cover, SearchTree().to_igraph()
+    if cuts == 'none':
+        engine = RELAXATIONS[relaxation](graph, cache=cache)
+    else:
+        engine = CuttingPlaneLP(
+            graph, cache=cache,
+            node_rounds=NODE_CUT_ROUNDS if cuts == 'nodes' else 0)
+    if isinstance(engine, WarmStartedLP) and engine.solver is None: 
         return (), ig.Graph()
-    solver.Solve()
-    
-    objective: float = len(graph.vs)
-    vars: list[pywraplp.Variable] = []
+    stats.relaxation_time += time.perf_counter() - start
+    rule = BranchingRule(branching, engine, graph.degree())
 
-    stack: list[tuple[str, pywraplp.Solver, list[tuple[int, int]]]] = \
-        [('root', solver, [])]
-    
-    optimum = objective
+    optimum: float = len(graph.vs) + 1
     best_solution: tuple[float, ...] = ()
+    root_bound = 0.
+    root: tuple[float, tuple[float, ...]] | None = None
+    if cache is not None:
+        root_key = cache.key(graph, relaxation=relaxation, cuts=cuts)
+        cached_root = cache.load_root(root_key)
+        if cached_root is not None:
+            root_bound, root_values, root_cuts = cached_root
+            root = (root_bound, root_values)
+            if isinstance(engine, CuttingPlaneLP):
+                engine.add_cuts(root_cuts)
+    if heuristics:
+        start = time.perf_counter()
+        if root is None:
+            status, root_bound, root_values = engine.solve([])
+            if status == pywraplp.Solver.OPTIMAL:
+                root = (root_bound, root_values)
+                if cache is not None:
+                    cache.store_root(root_key, root_bound, root_values,
+                                     getattr(engine, 'cuts', ()))
+            else:
+                root_bound = 0.
+        stats.relaxation_time += time.perf_counter() - start
+        start = time.perf_counter()
+        best_solution = best_cover(graph, None if root is None else root[1])
+        optimum = sum(best_solution)
+        stats.branching_time += time.perf_counter() - start
+        if incumbent_callback is not None:
+            incumbent_callback(best_solution, math.ceil(root_bound - TOLERANCE))
 
-    tree = ig.Graph()
-    tree.add_vertex('root', label='root')
+    tree = SearchTree()
+    if processes is not None and processes > 1:
+        _, best_solution, exhausted = _explore_parallel(
+            graph, engine, tree, stats, search, relaxation, processes,
+            split_depth, task_node_limit, progress_callback, progress_interval,
+            optimum, best_solution, root_bound, node_limit, deadline,
+            gap_limit, incumbent_callback, rule, root)
+    else:
+        _, best_solution, remaining = _explore(
+            engine, [(root_bound, 0, [])], tree, stats, search, optimum,
+            best_solution, node_limit=node_limit, deadline=deadline,
+            gap_limit=gap_limit, incumbent_callback=incumbent_callback,
+            progress_callback=progress_callback,
+            progress_interval=progress_interval, branching=rule, root=root)
+        # every stop on a limit leaves the open nodes in `remaining`
+        exhausted = len(remaining) == 0
 
-    node_idx = 1
-    while len(stack) > 0:
-        parent_node, solved_problem, fixed_vars = stack.pop()
+    # only a search that ran to the end proves the cover optimal
+    if cache is not None and exhausted and len(best_solution) > 0:
+        cache.store_cover(graph, best_solution)
+    return best_solution, tree.to_igraph()
 
-        objective = get_objective_value(solved_problem.variables())
-        vars = solved_problem.variables()
-        
-        branching_index: int | None = None
-        for i, var in enumerate(vars):
-            if 0 < var.solution_value() < 1:
-                branching_index = i
-                break
-        
-        if branching_index is None:
-            if objective < optimum:
-                optimum = objective
-                best_solution = tuple(var.solution_value() for var in vars)
+
+# Components up to this size are solved by enumeration instead of a model
+SMALL_COMPONENT = 12
+
+
+def _small_component_cover(graph: ig.Graph) -> tuple[float, ...]:
+    """Minimum vertex cover of a small connected graph: stars and cliques 
+    in closed form, anything else by enumerating every subset."""
+    n, m = graph.vcount(), graph.ecount()
+    degrees = graph.degree()
+    if m == 0:
+        return (0.,) * n
+    if m == n - 1 and max(degrees) == n - 1: # star: its center
+        center = degrees.index(n - 1)
+        return tuple(float(v == center) for v in range(n))
+    if 2 * m == n * (n - 1): # clique: all but one vertex
+        return (0.,) + (1.,) * (n - 1)
+
+    edges = np.array(graph.get_edgelist(), dtype=np.int64)
+    subsets = (np.arange(1 << n)[:, None] >> np.arange(n)) & 1
+    covers = np.all(subsets[:, edges[:, 0]] | subsets[:, edges[:, 1]], axis=1)
+    sizes = np.where(covers, subsets.sum(axis=1), n + 1)
+    return tuple(subsets[np.argmin(sizes)].astype(float).tolist())
+
+
+def solve_components(graph: ig.Graph,
+                     solve_component: Callable[[ig.Graph], tuple[float, ...]],
+                     processes: int | None = None,
+                     small_component: int = SMALL_COMPONENT
+                     ) -> tuple[float, ...]:
+    """Solves vertex cover separately on each connected component of `graph`.
+
+    Isolated vertices are left out, components with up to 
+    `small_component` vertices are solved by `_small_component_cover` and 
+    the others by `solve_component`, in a pool of `processes` worker 
+    processes when more than one is asked for. `solve_component` must then 
+    be picklable (a module-level function or a `functools.partial` of one).
+
+    Args:
+        graph (ig.Graph): An ig.Graph object representing the graph.
+        solve_component (Callable[[ig.Graph], tuple[float, ...]]): Returns a 
+        binary cover of a connected graph.
+        processes (int, optional): Defaults to None (serial).
+        small_component (int, optional): Defaults to SMALL_COMPONENT.
+
+    Returns:
+        tuple[float, ...]: The binary cover of `graph`.
+    """
+    solution = np.zeros(graph.vcount())
+    large: list[list[int]] = []
+    for members in graph.connected_components():
+        if len(members) == 1:
             continue
-        
-        fixed_vars_ceil = fixed_vars + [(branching_index, 1)]
-        fixed_vars_floor = fixed_vars + [(branching_index, 0)]
+        if len(members) <= small_component:
+            solution[members] = _small_component_cover(graph.induced_subgraph(members))
+        else:
+            large.append(members)
 
-        solver_ceil = generate_vertex_cover_problem(graph, fixed_vars_ceil)
-        solver_floor = generate_vertex_cover_problem(graph, fixed_vars_floor)
+    subgraphs = [graph.induced_subgraph(members) for members in large]
+    if processes is not None and processes > 1 and len(large) > 1:
+        with ProcessPoolExecutor(processes) as executor:
+            covers = list(executor.map(solve_component, subgraphs))
+    else:
+        covers = [solve_component(subgraph) for subgraph in subgraphs]
+    for members, cover in zip(large, covers):
+        if len(cover) != len(members):
+            raise RuntimeError('A component could not be solved.')
+        solution[members] = cover
+    return tuple(solution.tolist())
 
-        if (solver_ceil is None or solver_floor is None):
-            return (), ig.Graph()
 
-        solver_ceil.Solve()
-        solver_floor.Solve()
+def _bab_cover(graph: ig.Graph, **options) -> tuple[float, ...]:
+    return solve_bab_vertex_cover(graph, **options)[0]
 
-        ceil_label = f'x{branching_index}=1'
-        floor_label = f'x{branching_index}=0'
-        ceil_node = str(node_idx)
-        node_idx += 1
-        floor_node = str(node_idx)
-        node_idx += 1
-        tree.add_vertex(
-            ceil_node, 
-            label=f'{ceil_label}\n{get_objective_value(solver_ceil.variables())}')
-        tree.add_edge(parent_node, ceil_node)
-        tree.add_vertex(
-            floor_node, 
-            label=f'{floor_label}\n{get_objective_value(solver_floor.variables())}')
-        tree.add_edge(parent_node, floor_node)
 
-        stack.append(
-            (ceil_node, solver_ceil, fixed_vars_ceil)
-        )
-        stack.append(
-            (floor_node, solver_floor, fixed_vars_floor)
-        )
+def solve_vertex_cover_by_components(graph: ig.Graph,
+                                     processes: int | None = None,
+                                     small_component: int = SMALL_COMPONENT,
+                                     **options) -> tuple[float, ...]:
+    """Solves vertex cover with the branch-and-bound, one connected 
+    component at a time (see `solve_components`). The components are 
+    spread over `processes` worker processes; `options` go to 
+    `solve_bab_vertex_cover`.
 
-    return best_solution, tree    
+    Returns:
+        tuple[float, ...]: The binary cover of `graph`.
+    """
+    return solve_components(graph, partial(_bab_cover, **options),
+                            processes, small_component)
 
 
 def print_solution(vars: tuple[float, ...]):
@@ -187,19 +1115,31 @@ def print_solution(vars: tuple[float, ...]):
         print(f'x_{i} = {var}')
 
 
-def run_example(gg: ig.Graph, solver_version = SOLVER):
+def run_example(gg: ig.Graph, solver_version = SOLVER, 
+                cache: ModelCache | None = None):
     """Generates an LP/LIP vertex cover problem from the graph 
     `gg`, solves it with the given solver and plots its solution.
 
     Args:
         gg (ig.Graph): The graph to cover by vertices.
         solver_version (str, optional): The underlying solver. Defaults to SOLVER (global constant).
+        cache (ModelCache, optional): If given, the model and the solution 
+        are reused from earlier runs with the same solver. Defaults to None.
     """    
-    solver = generate_vertex_cover_problem(gg, solver_version=solver_version)
+    if cache is not None:
+        key = cache.key(gg, solver_version=solver_version, named_constraints=True)
+        root = cache.load_root(key)
+        if root is not None:
+            plot_solved_graph(root[1], gg)
+            return
+    solver = generate_vertex_cover_problem(gg, solver_version=solver_version, 
+                                           cache=cache)
     if not solver: 
         return
-    solver.Solve()
+    status = solver.Solve()
     solution = tuple(var.solution_value() for var in solver.variables())
+    if cache is not None and status == pywraplp.Solver.OPTIMAL:
+        cache.store_root(key, sum(solution), solution)
     plot_solved_graph(solution, gg)
 
 
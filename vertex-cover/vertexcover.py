@@ -1,10 +1,39 @@
 #!pip install ortools
-from ortools.linear_solver import pywraplp
-
-def vertex_cover(grafo):
+import math
+import time
+
+import igraph as ig
+import numpy as np
+from ortools.linear_solver import linear_solver_pb2, pywraplp
+
+from graph_io import deduplicate_edges, read_edges
+from kernelization import kernelize
+import vertex_cover as vc
+
+def vertex_cover(arestas, n=None, limite_tempo=30., limite_nos=None, gap=0.01,
+                 ao_melhorar=None, fatia=1.):
+    '''Resolve o problema pelo SCIP, dado o grafo pelo vetor (m, 2) de
+    arestas (sem repeticoes, como o de `graph_io.read_edges`), com uma
+    restricao por aresta. `n` e' o numero de vertices (padrao: o maior
+    vertice mais um).
+
+    `limite_tempo` (segundos), `limite_nos` e `gap` (relativo) viram os
+    parametros limits/time, limits/nodes e limits/gap do SCIP; `None`
+    desliga o limite. Com `ao_melhorar`, o SCIP roda em fatias ate o
+    limite de tempo, e `ao_melhorar(solucao, limitante)` recebe cada
+    solucao melhor com o maior limitante inferior conhecido. O SCIP nao
+    retoma uma busca interrompida, entao cada fatia resolve de novo uma
+    copia do modelo, partindo da melhor solucao anterior como dica, e dura
+    o dobro da anterior (a primeira dura `fatia` segundos). Nesse modo os
+    limites de nos e gap valem para cada fatia, e as fatias param quando
+    uma delas nao melhora a solucao nem o limitante, nao encontra solucao
+    ou para por um limite que nao o de tempo; o solver devolvido e' o da
+    ultima fatia.'''
     TOL = 1.0e-6
 
-    n = len(g)
+    arestas = np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+    if n is None:
+        n = int(arestas.max()) + 1 if len(arestas) > 0 else 0
    
     solver = pywraplp.Solver.CreateSolver('SCIP')
     if not solver:
@@ -17,29 +46,75 @@ def vertex_cover(grafo):
     print('Numero de variaveis =', solver.NumVariables())
 
     # Restricoes
-    for v1 in range(n):
-        for v2 in g[v1]:
-            solver.Add( x[v1] + x[v2]  >= 1 )
+    for v1, v2 in arestas.tolist():
+        restricao = solver.Constraint(1, solver.infinity())
+        restricao.SetCoefficient(x[v1], 1)
+        restricao.SetCoefficient(x[v2], 1)
 
     print('Numero de restricoes =', solver.NumConstraints())
 
     # Funcao objetivo e sentido de otimizacao
     solver.Minimize( sum(x) )
 
-    #solver.set_time_limit(5000)
-    solverParams = pywraplp.MPSolverParameters()
-    
-    # Configurando parametros do solver
-    solver.SetSolverSpecificParametersAsString("limits/gap=0.01, limits/time=30, " + \
-                                               "limits/bestsol=20, " + \
-                                               "heuristics/bound/onlywithoutsol=0, " + \
-                                               "heuristics/bound/freq = 20")
-    
+    def parametros(tempo):
+        limites = []
+        if gap is not None:
+            limites.append(f'limits/gap={gap}')
+        if tempo is not None:
+            limites.append(f'limits/time={tempo}')
+        if limite_nos is not None:
+            limites.append(f'limits/nodes={limite_nos}')
+        return ', '.join(limites + ['limits/bestsol=20',
+                                    'heuristics/bound/onlywithoutsol=0',
+                                    'heuristics/bound/freq = 20'])
 
     # Resolver o problema
-    status = solver.Solve()
-
-    if status == pywraplp.Solver.OPTIMAL:
+    status = pywraplp.Solver.NOT_SOLVED
+    if ao_melhorar is None:
+        solver.SetSolverSpecificParametersAsString(parametros(limite_tempo))
+        status = solver.Solve()
+    else:
+        modelo = linear_solver_pb2.MPModelProto()
+        solver.ExportModelToProto(modelo)
+        inicio = time.perf_counter()
+        melhor = math.inf
+        limitante = 0.
+        solucao = None
+        while True:
+            restante = math.inf if limite_tempo is None else \
+                limite_tempo - (time.perf_counter() - inicio)
+            if restante <= 0:
+                break
+            duracao = min(fatia, restante)
+            fatia *= 2
+            solver = pywraplp.Solver.CreateSolver('SCIP')
+            solver.LoadModelFromProto(modelo)
+            solver.EnableOutput()
+            x = solver.variables()
+            if solucao is not None:
+                solver.SetHint(x, solucao)
+            solver.SetSolverSpecificParametersAsString(parametros(duracao))
+            inicio_fatia = time.perf_counter()
+            status = solver.Solve()
+            # uma fatia que acaba antes do tempo parou por outro limite (nos,
+            # numero de solucoes): as seguintes parariam no mesmo ponto
+            outro_limite = time.perf_counter() - inicio_fatia < 0.9 * duracao
+            if status not in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
+                break
+            progresso = False
+            novo_limitante = math.ceil(solver.Objective().BestBound() - TOL)
+            if novo_limitante > limitante:
+                limitante = novo_limitante
+                progresso = True
+            if solver.Objective().Value() < melhor - TOL:
+                melhor = solver.Objective().Value()
+                solucao = [v.solution_value() for v in x]
+                ao_melhorar(tuple(solucao), limitante)
+                progresso = True
+            if status == pywraplp.Solver.OPTIMAL or outro_limite or not progresso:
+                break
+
+    if status in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
         print('\nValor da funcao objetivo =', solver.Objective().Value())
         '''print('Solucao:')
         for v in range(n):
@@ -53,22 +128,66 @@ def vertex_cover(grafo):
     return solver
 
 
-import random as rd
-rd.seed(147)
+METODOS = ('scip', 'bab')
+
+def _cobertura_scip(grafo: ig.Graph) -> tuple[float, ...]:
+    arestas = np.array(grafo.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+    solver = vertex_cover(arestas, grafo.vcount())
+    if solver is None:
+        return ()
+    return tuple(x.solution_value() for x in solver.variables())
+
+
+def vertex_cover_componentes(grafo: ig.Graph, metodo='scip', processos=None):
+    '''Resolve cada componente conexa do grafo separadamente (ver
+    `vertex_cover.solve_components`): as pequenas por enumeracao, as demais
+    pelo SCIP (`vertex_cover`) ou pelo branch-and-bound de `vertex_cover.py`,
+    distribuidas entre `processos` processos. Devolve a cobertura como vetor
+    binario.'''
+    if metodo not in METODOS:
+        raise ValueError(f'metodo deve ser um de {METODOS}.')
+    resolver = _cobertura_scip if metodo == 'scip' else vc._bab_cover
+    return vc.solve_components(grafo, resolver, processos)
+
+
+def vertex_cover_kernel(grafo: ig.Graph, metodo='scip', processos=None):
+    '''Reduz o grafo ao seu kernel (ver `kernelization`), resolve o kernel
+    componente a componente (`vertex_cover_componentes`) e devolve a
+    cobertura do grafo original como vetor binario.'''
+    if metodo not in METODOS:
+        raise ValueError(f'metodo deve ser um de {METODOS}.')
+
+    kernel = kernelize(grafo)
+    print(f'Kernel: {kernel.graph.vcount()} de {grafo.vcount()} vertices, '
+          f'{kernel.graph.ecount()} de {grafo.ecount()} arestas')
+
+    solucao = vertex_cover_componentes(kernel.graph, metodo, processos)
+    return kernel.lift(solucao)
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) > 1:
+        # grafo DIMACS (.clq/.col) ou lista de arestas, possivelmente .gz
+        n, arestas = read_edges(sys.argv[1])
+    else:
+        import random as rd
+        rd.seed(147)
 
-n = 150
-N = list(range(n))
-g=[[] for _ in range(n)]
+        n = 150
+        N = list(range(n))
+        g = set()
 
-cont = 0
-while cont < 0.5*(n*(n-1)/2):
-    i = rd.choice(N)
-    j = rd.choice(N)
+        cont = 0
+        while cont < 0.5*(n*(n-1)/2):
+            i = rd.choice(N)
+            j = rd.choice(N)
 
-    if i != j:
-        if j not in g[i]:
-            g[i].append(j)
-            g[j].append(i)
-            cont += 1
+            if i != j:
+                if (min(i, j), max(i, j)) not in g:
+                    g.add((min(i, j), max(i, j)))
+                    cont += 1
+        arestas = deduplicate_edges(np.array(sorted(g)), n)
 
-s = vertex_cover(g)
+    s = vertex_cover(arestas, n)